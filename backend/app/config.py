@@ -12,6 +12,14 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
+    # bcrypt cost factor (2^rounds 반복). 기본 12, 운영 CPU에 맞춰 조정
+    bcrypt_rounds: int = 12
+
+    # 생성 요청 제한: 사용자당 분당 요청 수 (0 이하면 제한 없음)
+    generate_rate_limit_per_minute: int = 10
+    # Vertex AI 호출 속도 제한: 프로세스당 분당 요청 수 (Vertex 쿼터 기준, 0 이하면 제한 없음)
+    vertex_image_requests_per_minute: int = 60
+    vertex_video_requests_per_minute: int = 10
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -1,9 +1,20 @@
+import os
+
 from prisma import Prisma
 
-db = Prisma()
+# 쿼리 로깅: 개발 시 PRISMA_LOG_QUERIES=true 로만 활성화 (기본 off → 운영 요청마다 로그 포맷 비용 없음)
+PRISMA_LOG_QUERIES = os.environ.get("PRISMA_LOG_QUERIES", "").lower() == "true"
+
+# 프로세스 전역 단일 클라이언트 (커넥션 풀 공유).
+# 모든 라우터/QueueWorker는 이 인스턴스만 import해서 사용하고 새 Prisma()를 만들지 않는다.
+# 풀 크기는 DATABASE_URL의 connection_limit / pool_timeout 파라미터로 지정.
+db = Prisma(log_queries=PRISMA_LOG_QUERIES)
 
 async def connect_db():
-    await db.connect()
+    # lifespan이 여러 번 호출돼도 커넥션 풀을 중복 생성하지 않음
+    if not db.is_connected():
+        await db.connect()
 
 async def disconnect_db():
-    await db.disconnect()
+    if db.is_connected():
+        await db.disconnect()
@@ -5,20 +5,28 @@ from fastapi.staticfiles import StaticFiles
 from app.db import connect_db, disconnect_db
 from app.routers import generate, assets, auth, admin
 from app.services.queue_worker import queue_worker
+from app.services.vertex_ai import close_vertex_ai_service, get_vertex_ai_service
 from app.config import get_settings
+import asyncio
 import os
 
 settings = get_settings()
 
+def _ensure_storage_dirs():
+    for sub_dir in ("images", "videos", "temp"):
+        os.makedirs(os.path.join(settings.storage_path, sub_dir), exist_ok=True)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    os.makedirs(os.path.join(settings.storage_path, "images"), exist_ok=True)
-    os.makedirs(os.path.join(settings.storage_path, "videos"), exist_ok=True)
-    os.makedirs(os.path.join(settings.storage_path, "temp"), exist_ok=True)
+    await asyncio.to_thread(_ensure_storage_dirs)
     await connect_db()
+    # Vertex AI 초기화(인증 파일 읽기, vertexai.init, from_pretrained 네트워크 호출)는 블로킹 →
+    # 워커가 첫 Job을 처리하기 전에 스레드에서 한 번 수행 (인증 정보가 잘못되면 여기서 기동 실패)
+    await asyncio.to_thread(get_vertex_ai_service)
     await queue_worker.start(num_workers=5)
     yield
     await queue_worker.stop()
+    await close_vertex_ai_service()
     await disconnect_db()
 
 app = FastAPI(title="Vertex AI Asset Generator", lifespan=lifespan)
@@ -1,49 +1,40 @@
 from fastapi import APIRouter, Depends
 from app.services.auth import get_current_user
-from app.services.vertex_ai import IMAGE_SEMAPHORE, VIDEO_SEMAPHORE
+from app.services.vertex_ai import get_concurrency_stats, get_http_pool_stats
 from app.services.queue_worker import queue_worker
 from app.db import db
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
+# 상태별 Job 수를 한 번의 쿼리로 집계 (status별 count 4회 → 1회)
+JOB_STATUS_COUNTS_SQL = """
+SELECT
+    COUNT(*) FILTER (WHERE status = 'queued')::int AS queued,
+    COUNT(*) FILTER (WHERE status = 'processing')::int AS processing,
+    COUNT(*) FILTER (WHERE status = 'completed')::int AS completed,
+    COUNT(*) FILTER (WHERE status = 'failed')::int AS failed
+FROM jobs
+"""
+
 
 @router.get("/queue-status")
 async def queue_status(current_user=Depends(get_current_user)):
     """
     큐잉 시스템 모니터링 엔드포인트.
-    Semaphore 상태, 큐 대기 수, DB 기반 Job 통계를 반환한다.
+    Semaphore 상태, Vertex AI 커넥션 풀 재사용 현황, 큐 대기 수, DB 기반 Job 통계를 반환한다.
     """
-    image_max = 10
-    video_max = 3
-
-    image_available = IMAGE_SEMAPHORE._value
-    video_available = VIDEO_SEMAPHORE._value
-
-    queued_count = await db.job.count(where={"status": "queued"})
-    processing_count = await db.job.count(where={"status": "processing"})
-    completed_count = await db.job.count(where={"status": "completed"})
-    failed_count = await db.job.count(where={"status": "failed"})
+    job_counts = await db.query_first(JOB_STATUS_COUNTS_SQL)
 
     return {
-        "semaphore": {
-            "image": {
-                "max": image_max,
-                "available": image_available,
-                "in_use": image_max - image_available,
-            },
-            "video": {
-                "max": video_max,
-                "available": video_available,
-                "in_use": video_max - video_available,
-            },
-        },
+        "semaphore": get_concurrency_stats(),
+        "http_pool": get_http_pool_stats(),
         "queue": {
             "pending": queue_worker.pending_count,
         },
         "jobs": {
-            "queued": queued_count,
-            "processing": processing_count,
-            "completed": completed_count,
-            "failed": failed_count,
+            "queued": job_counts["queued"],
+            "processing": job_counts["processing"],
+            "completed": job_counts["completed"],
+            "failed": job_counts["failed"],
         },
     }
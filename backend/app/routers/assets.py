@@ -1,13 +1,26 @@
-import os
+import asyncio
+import logging
 from fastapi import APIRouter, HTTPException, Depends
 from app.db import db
 from app.services.auth import get_current_user
+from app.services.asset_cache import asset_cache
+from app.services.storage import resolve_storage_path
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 router = APIRouter(prefix="/api/assets", tags=["assets"])
 
 
+def _remove_asset_file(file_url: str) -> None:
+    """/storage/... URL에 해당하는 물리 파일 삭제 (storage 디렉터리 밖을 가리키는 경로는 삭제하지 않음)"""
+    file_path = resolve_storage_path(file_url, settings.storage_path)
+    if file_path is None:
+        logger.warning(f"[Assets] Refused to delete file outside storage: {file_url}")
+        return
+    file_path.unlink(missing_ok=True)
+
+
 @router.get("/")
 async def list_assets(skip: int = 0, limit: int = 20, current_user=Depends(get_current_user)):
     """본인 에셋만 조회 (최신순)"""
@@ -35,13 +48,11 @@ async def delete_asset(asset_id: int, current_user=Depends(get_current_user)):
     if not asset:
         raise HTTPException(status_code=404, detail="에셋을 찾을 수 없습니다.")
 
-    # 물리 파일 삭제
+    # 물리 파일 삭제 (블로킹 파일시스템 호출은 스레드에서 실행)
     if asset.filePath:
-        relative_path = asset.filePath.lstrip("/storage/")
-        file_path = os.path.join(settings.storage_path, relative_path)
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        await asyncio.to_thread(_remove_asset_file, asset.filePath)
 
     # DB 레코드 삭제
     await db.asset.delete(where={"id": asset_id})
+    asset_cache.invalidate_asset(asset_id)
     return {"message": "삭제되었습니다."}
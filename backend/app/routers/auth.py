@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel, EmailStr
 from app.db import db
@@ -61,7 +62,8 @@ async def signup(request: SignupRequest):
             detail="이미 사용 중인 유저네임입니다.",
         )
 
-    hashed = hash_password(request.password)
+    # bcrypt는 CPU 바운드(수십~수백 ms) → 스레드에서 실행해 이벤트 루프 차단 방지 (bcrypt는 해싱 중 GIL 해제)
+    hashed = await asyncio.to_thread(hash_password, request.password)
     user = await db.user.create(data={
         "email": request.email,
         "username": request.username,
@@ -73,7 +75,7 @@ async def signup(request: SignupRequest):
 @router.post("/login", response_model=TokenResponse)
 async def login(request: LoginRequest):
     user = await db.user.find_unique(where={"email": request.email})
-    if not user or not verify_password(request.password, user.password):
+    if not user or not await asyncio.to_thread(verify_password, request.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
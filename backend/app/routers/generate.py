@@ -1,16 +1,19 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, Form, Header, HTTPException, Depends
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal
-from uuid import uuid4
 from datetime import datetime
-import json
+import orjson
+import asyncio
+import math
 import os
-import aiofiles
+import shutil
 from app.db import db
-from app.services.job_manager import job_manager
+from app.services.job_manager import JobInfo, job_manager, new_job_id
+from app.services.asset_cache import asset_cache, normalize_prompt, prompt_hash
 from app.services.queue_worker import queue_worker
 from app.services.auth import get_current_user
+from app.services.rate_limiter import RateLimiter
 from app.config import get_settings
 import logging
 
@@ -19,11 +22,57 @@ settings = get_settings()
 
 router = APIRouter(prefix="/api/generate", tags=["generate"])
 
+# 업로드 이미지를 임시 파일로 옮길 때의 청크 크기 (요청당 메모리 사용량 상한)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# image-to-video 업로드 제한 (Veo 입력 이미지 허용 형식 → 저장 확장자)
+MAX_IMAGE_UPLOAD_BYTES = 10 * 1024 * 1024
+ALLOWED_IMAGE_TYPES = {"image/png": "png", "image/jpeg": "jpg", "image/webp": "webp"}
+
+# 사용자별 생성 요청 제한 (한 사용자가 큐와 Semaphore를 독점하지 못하도록)
+generate_rate_limiter = RateLimiter(settings.generate_rate_limit_per_minute, window_seconds=60)
+
+
+def enforce_generate_rate_limit(user_id: int) -> None:
+    """
+    생성 요청 1회 기록, 한도 초과 시 429.
+    검증(413/415/422)을 통과하고 실제로 Job을 큐에 넣는 경로에서만 호출 (거부된 요청/캐시 히트는 한도를 쓰지 않음)
+    """
+    retry_after = generate_rate_limiter.hit(user_id)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=429,
+            detail="생성 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+async def validate_image(
+    image: UploadFile = File(...),
+    content_length: Optional[int] = Header(None),
+) -> UploadFile:
+    """업로드 이미지 사전 검증: 크기 초과 413, 허용되지 않는 형식 415 (임시 파일 저장/Job 생성 전에 거부)"""
+    size = image.size if image.size is not None else content_length
+    if size is not None and size > MAX_IMAGE_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"이미지 크기는 최대 {MAX_IMAGE_UPLOAD_BYTES // (1024 * 1024)}MB까지 업로드할 수 있습니다.",
+        )
+    if image.content_type not in ALLOWED_IMAGE_TYPES:
+        raise HTTPException(
+            status_code=415,
+            detail="PNG, JPEG, WEBP 형식의 이미지만 업로드할 수 있습니다.",
+        )
+    return image
+
 
 # ===== Request Models (Vertex AI Docs 기반 파라미터) =====
 
 class ImageGenerateRequest(BaseModel):
     """Text-to-Image 요청 — Imagen 3.0 Python SDK 파라미터 (inspect.signature 검증 완료)"""
+    # 요청 후 변경되지 않음 + 정의되지 않은 옵션은 조용히 버리지 않고 422로 거부
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     prompt: str
     model: str
 
@@ -47,6 +96,9 @@ class ImageGenerateRequest(BaseModel):
 
 class VideoGenerateRequest(BaseModel):
     """Text-to-Video 요청 — Veo 3.0 파라미터 (Vertex AI Docs 기반)"""
+    # 요청 후 변경되지 않음 + 정의되지 않은 옵션은 조용히 버리지 않고 422로 거부
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     prompt: str
     model: str
 
@@ -64,6 +116,27 @@ class VideoGenerateRequest(BaseModel):
     resolution: Optional[Literal["720p", "1080p"]] = None
 
 
+# 옵션 필드 목록을 모듈 로드 시 한 번만 계산 (요청마다 model_dump 직렬화 경로를 거치지 않음)
+_IMAGE_OPTION_FIELDS = tuple(f for f in ImageGenerateRequest.model_fields if f not in ("prompt", "model"))
+_VIDEO_OPTION_FIELDS = tuple(f for f in VideoGenerateRequest.model_fields if f not in ("prompt", "model"))
+
+
+def _save_upload(src, temp_path: str) -> None:
+    """
+    업로드 파일을 임시 경로로 복사 (to_thread에서 호출).
+    청크 단위 복사라 메모리 사용량은 파일 크기와 무관하고,
+    청크마다 스레드풀을 왕복하던 aiofiles 대신 복사 전체를 스레드 한 번에 처리한다.
+    """
+    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+    with open(temp_path, "wb") as f:
+        shutil.copyfileobj(src, f, UPLOAD_CHUNK_SIZE)
+
+
+def _collect_options(request: BaseModel, fields: tuple) -> dict:
+    """None이 아닌 옵션만 추출 (model_dump(exclude_none=True)와 동일한 결과)"""
+    return {k: v for k in fields if (v := getattr(request, k)) is not None}
+
+
 class GenerateResponse(BaseModel):
     job_id: str
     status: str
@@ -78,15 +151,22 @@ class JobStatusResponse(BaseModel):
 
 # ===== 캐시 조회 =====
 
-async def find_cached_asset(prompt: str, model: str, asset_type: str) -> Optional[dict]:
+async def find_cached_asset(normalized_prompt: str, model: str, asset_type: str) -> Optional[dict]:
     """
-    동일 prompt + model + assetType 조합의 기존 에셋을 DB에서 검색.
+    동일 prompt + model + assetType 조합의 기존 에셋을 검색.
+    인메모리 LRU를 먼저 확인하고, 없을 때만 DB를 조회한다.
+    normalized_prompt는 호출 측에서 normalize_prompt()로 한 번만 정규화해 전달.
     캐시 히트 시 asset_id와 result_url을 반환, 없으면 None.
     """
-    normalized_prompt = prompt.strip().lower()
+    cached = asset_cache.get(normalized_prompt, model, asset_type)
+    if cached:
+        logger.info(f"[Cache] HIT (memory) - prompt='{normalized_prompt[:30]}...', model={model}")
+        return cached
 
     asset = await db.asset.find_first(
+        # 고정 길이 promptHash로 인덱스를 탐색하고, prompt 비교는 해시 충돌 대비 재확인용
         where={
+            "promptHash": prompt_hash(normalized_prompt),
             "prompt": normalized_prompt,
             "model": model,
             "assetType": asset_type,
@@ -96,6 +176,7 @@ async def find_cached_asset(prompt: str, model: str, asset_type: str) -> Optiona
 
     if asset and asset.filePath:
         logger.info(f"[Cache] HIT - prompt='{normalized_prompt[:30]}...', model={model}")
+        asset_cache.put(normalized_prompt, model, asset_type, asset.id, asset.filePath)
         return {
             "asset_id": asset.id,
             "result_url": asset.filePath,
@@ -105,6 +186,31 @@ async def find_cached_asset(prompt: str, model: str, asset_type: str) -> Optiona
     return None
 
 
+async def create_cached_job(cached: dict, job_type: str, prompt: str, model: str, user_id: int) -> JobInfo:
+    """
+    캐시 히트 Job 등록: 생성 없이 바로 completed.
+    인메모리에서 제거(상한 초과/재시작)돼도 상태 조회가 되도록 완료 상태로 jobs 테이블에도 기록한다.
+    """
+    job_id = new_job_id()
+    await db.job.create(data={
+        "jobId": job_id,
+        "jobType": job_type,
+        "prompt": prompt,
+        "model": model,
+        "userId": user_id,
+        "status": "completed",
+        "assetId": cached["asset_id"],
+        "resultUrl": cached["result_url"],
+    })
+    return await job_manager.create_job(
+        job_id,
+        status="completed",
+        asset_id=cached["asset_id"],
+        result_url=cached["result_url"],
+        persisted=True,
+    )
+
+
 # ===== API Endpoints =====
 
 @router.post("/text-to-image", response_model=GenerateResponse)
@@ -112,23 +218,17 @@ async def text_to_image(
     request: ImageGenerateRequest,
     current_user=Depends(get_current_user),
 ):
-    options = request.model_dump(exclude={"prompt", "model"}, exclude_none=True)
+    options = _collect_options(request, _IMAGE_OPTION_FIELDS)
 
     if not options:
-        cached = await find_cached_asset(request.prompt, request.model, "image")
+        cached = await find_cached_asset(normalize_prompt(request.prompt), request.model, "image")
         if cached:
-            job_id = str(uuid4())
-            job = await job_manager.create_job(job_id)
-            await job_manager.update_job(
-                job_id,
-                status="completed",
-                asset_id=cached["asset_id"],
-                result_url=cached["result_url"],
-            )
-            return GenerateResponse(job_id=job_id, status="completed", created_at=job.created_at)
-
-    job_id = str(uuid4())
-    options_json = json.dumps(options) if options else None
+            job = await create_cached_job(cached, "text-to-image", request.prompt, request.model, current_user.id)
+            return GenerateResponse(job_id=job.job_id, status="completed", created_at=job.created_at)
+
+    enforce_generate_rate_limit(current_user.id)
+    job_id = new_job_id()
+    options_json = orjson.dumps(options).decode() if options else None
 
     await db.job.create(data={
         "jobId": job_id,
@@ -138,7 +238,7 @@ async def text_to_image(
         "userId": current_user.id,
         "options": options_json,
     })
-    job = await job_manager.create_job(job_id)
+    job = await job_manager.create_job(job_id, persisted=True)
     await queue_worker.enqueue(job_id)
 
     return GenerateResponse(job_id=job_id, status="pending", created_at=job.created_at)
@@ -148,23 +248,17 @@ async def text_to_video(
     request: VideoGenerateRequest,
     current_user=Depends(get_current_user),
 ):
-    options = request.model_dump(exclude={"prompt", "model"}, exclude_none=True)
+    options = _collect_options(request, _VIDEO_OPTION_FIELDS)
 
     if not options:
-        cached = await find_cached_asset(request.prompt, request.model, "video")
+        cached = await find_cached_asset(normalize_prompt(request.prompt), request.model, "video")
         if cached:
-            job_id = str(uuid4())
-            job = await job_manager.create_job(job_id)
-            await job_manager.update_job(
-                job_id,
-                status="completed",
-                asset_id=cached["asset_id"],
-                result_url=cached["result_url"],
-            )
-            return GenerateResponse(job_id=job_id, status="completed", created_at=job.created_at)
-
-    job_id = str(uuid4())
-    options_json = json.dumps(options) if options else None
+            job = await create_cached_job(cached, "text-to-video", request.prompt, request.model, current_user.id)
+            return GenerateResponse(job_id=job.job_id, status="completed", created_at=job.created_at)
+
+    enforce_generate_rate_limit(current_user.id)
+    job_id = new_job_id()
+    options_json = orjson.dumps(options).decode() if options else None
 
     await db.job.create(data={
         "jobId": job_id,
@@ -174,7 +268,7 @@ async def text_to_video(
         "userId": current_user.id,
         "options": options_json,
     })
-    job = await job_manager.create_job(job_id)
+    job = await job_manager.create_job(job_id, persisted=True)
     await queue_worker.enqueue(job_id)
 
     return GenerateResponse(job_id=job_id, status="pending", created_at=job.created_at)
@@ -183,7 +277,7 @@ async def text_to_video(
 async def image_to_video(
     prompt: str = Form(...),
     model: str = Form(...),
-    image: UploadFile = File(...),
+    image: UploadFile = Depends(validate_image),
     current_user=Depends(get_current_user),
     duration_seconds: Optional[int] = Form(None),
     seed: Optional[int] = Form(None),
@@ -200,20 +294,17 @@ async def image_to_video(
     if resize_mode is not None:
         options["resize_mode"] = resize_mode
 
-    job_id = str(uuid4())
-    image_bytes = await image.read()
-    mime_type = image.content_type or "image/png"
+    # 임시 파일 저장 전에 확인 (한도 초과 요청은 업로드를 디스크에 쓰지 않음)
+    enforce_generate_rate_limit(current_user.id)
+    job_id = new_job_id()
+    mime_type = image.content_type
 
     # 이미지를 임시 파일로 저장 (DB에 바이트 저장 대신 파일 경로 저장)
-    ext = "png" if "png" in mime_type else "jpg"
-    temp_dir = os.path.join(settings.storage_path, "temp")
-    os.makedirs(temp_dir, exist_ok=True)
-    temp_path = os.path.join(temp_dir, f"{job_id}.{ext}")
+    ext = ALLOWED_IMAGE_TYPES[mime_type]
+    temp_path = os.path.join(settings.storage_path, "temp", f"{job_id}.{ext}")
+    await asyncio.to_thread(_save_upload, image.file, temp_path)
 
-    async with aiofiles.open(temp_path, "wb") as f:
-        await f.write(image_bytes)
-
-    options_json = json.dumps(options) if options else None
+    options_json = orjson.dumps(options).decode() if options else None
 
     await db.job.create(data={
         "jobId": job_id,
@@ -225,14 +316,40 @@ async def image_to_video(
         "imagePath": temp_path,
         "mimeType": mime_type,
     })
-    job = await job_manager.create_job(job_id)
+    job = await job_manager.create_job(job_id, persisted=True)
     await queue_worker.enqueue(job_id)
 
     return GenerateResponse(job_id=job_id, status="pending", created_at=job.created_at)
 
+async def get_or_load_job(job_id: str) -> Optional[JobInfo]:
+    """
+    인메모리 Job 조회. 상한 초과로 제거된 Job이면 DB에서 복원해 다시 등록
+    (워커의 상태 갱신과 SSE 구독이 계속 동작하도록).
+    """
+    job = await job_manager.get_job(job_id)
+    if job is not None:
+        return job
+
+    db_job = await db.job.find_unique(where={"jobId": job_id})
+    if not db_job:
+        return None
+    # DB 조회(await) 중 다른 요청이 먼저 복원했을 수 있음 → 덮어쓰면 그쪽의 SSE 구독자/상태 갱신이 끊김
+    job = await job_manager.get_job(job_id)
+    if job is not None:
+        return job
+    return await job_manager.create_job(
+        job_id,
+        status="pending" if db_job.status == "queued" else db_job.status,
+        asset_id=db_job.assetId,
+        result_url=db_job.resultUrl,
+        error_message=db_job.errorMessage,
+        created_at=db_job.createdAt,
+        persisted=True,
+    )
+
 @router.get("/jobs/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str):
-    job = await job_manager.get_job(job_id)
+    job = await get_or_load_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return JobStatusResponse(
@@ -246,36 +363,32 @@ async def get_job_status(job_id: str):
 @router.get("/jobs/{job_id}/stream")
 async def stream_job_status(job_id: str):
     """SSE 엔드포인트: Job 상태 변화를 실시간 스트리밍"""
-    job = await job_manager.get_job(job_id)
+    job = await get_or_load_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    def _job_data(j) -> str:
-        return json.dumps({
-            "job_id": j.job_id,
-            "status": j.status,
-            "asset_id": j.asset_id,
-            "result_url": j.result_url,
-            "error_message": j.error_message,
-        })
-
     async def event_generator():
-        # 현재 상태를 즉시 전송
-        yield f"data: {_job_data(job)}\n\n"
-
-        # 이미 완료 상태이면 스트림 종료
-        if job.status in ("completed", "failed"):
-            return
+        # 첫 전송 전에 구독해야 스냅샷 이후의 상태 변화를 놓치지 않음
+        queue = job_manager.subscribe(job)
+        try:
+            # 현재 상태를 즉시 전송
+            current = job.latest_event()
+            yield b"data: " + current.payload + b"\n\n"
+
+            # 이미 완료 상태이면 스트림 종료
+            if current.status in ("completed", "failed"):
+                return
 
-        # 상태 변화를 대기하며 전송
-        while True:
-            job._event.clear()
-            await job._event.wait()
+            # 상태 변화 이벤트를 순서대로 전송 (payload는 update_job에서 한 번만 인코딩됨)
+            while True:
+                event = await queue.get()
 
-            yield f"data: {_job_data(job)}\n\n"
+                yield b"data: " + event.payload + b"\n\n"
 
-            if job.status in ("completed", "failed"):
-                return
+                if event.status in ("completed", "failed"):
+                    return
+        finally:
+            job_manager.unsubscribe(job, queue)
 
     return StreamingResponse(
         event_generator(),
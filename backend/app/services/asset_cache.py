@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import hashlib
+import time
+
+CacheKey = Tuple[str, str, str]  # (normalized_prompt, model, asset_type)
+
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_TTL_SECONDS = 300  # 다른 프로세스에서 삭제된 에셋을 최대 5분 안에 잊도록
+
+
+def normalize_prompt(prompt: str) -> str:
+    """캐시 키 / Asset.prompt 저장용 정규화 (앞뒤 공백 제거 + 소문자)"""
+    return prompt.strip().lower()
+
+
+def prompt_hash(normalized_prompt: str) -> str:
+    """Asset.promptHash 값: 정규화된 프롬프트의 SHA-256 hex (64자 고정 길이 인덱스 키)"""
+    return hashlib.sha256(normalized_prompt.encode("utf-8")).hexdigest()
+
+
+class AssetCache:
+    """
+    prompt + model + assetType → 최신 에셋 인메모리 LRU + TTL 캐시.
+    find_cached_asset이 DB 조회 전에 먼저 확인하여 반복 프롬프트의 SELECT를 생략한다.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        # key → (entry, 만료 시각[monotonic])
+        self._entries: "OrderedDict[CacheKey, Tuple[dict, float]]" = OrderedDict()
+        self._keys_by_asset: Dict[int, CacheKey] = {}
+
+    def get(self, prompt: str, model: str, asset_type: str) -> Optional[dict]:
+        key = (prompt, model, asset_type)
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        entry, expires_at = item
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, prompt: str, model: str, asset_type: str, asset_id: int, result_url: str) -> None:
+        key = (prompt, model, asset_type)
+        self._remove(key)
+
+        self._entries[key] = ({"asset_id": asset_id, "result_url": result_url}, time.monotonic() + self._ttl)
+        self._keys_by_asset[asset_id] = key
+
+        if len(self._entries) > self._maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate_asset(self, asset_id: int) -> None:
+        """에셋 삭제 시 해당 에셋을 가리키는 캐시 항목 제거"""
+        key = self._keys_by_asset.get(asset_id)
+        if key is not None:
+            self._remove(key)
+
+    def _remove(self, key: CacheKey) -> None:
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._keys_by_asset.pop(item[0]["asset_id"], None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_asset.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+asset_cache = AssetCache()
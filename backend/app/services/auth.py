@@ -1,7 +1,9 @@
 from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Tuple
 from uuid import uuid4
+import time
 import bcrypt
-from jose import jwt, JWTError
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.db import db
@@ -10,11 +12,17 @@ from app.config import get_settings
 settings = get_settings()
 security = HTTPBearer()
 
+# get_current_user용 사용자 캐시: user_id → (만료 시각[monotonic], User)
+# 인증 요청마다 발생하던 users 조회를 TTL 동안 생략 (토큰 폐기 시 즉시 무효화)
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 10000
+_user_cache: Dict[int, Tuple[float, Any]] = {}
+
 
 # ===== 비밀번호 =====
 
 def hash_password(plain: str) -> str:
-    return bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode("utf-8")
 
 def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
@@ -33,7 +41,7 @@ def decode_access_token(token: str) -> int:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
         user_id = int(payload["sub"])
         return user_id
-    except (JWTError, KeyError, ValueError):
+    except (jwt.PyJWTError, KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 인증 토큰입니다.",
@@ -89,12 +97,37 @@ async def rotate_refresh_token(old_token: str) -> tuple[str, str]:
 async def revoke_all_tokens(user_id: int):
     """해당 유저의 모든 Refresh Token 무효화 (탈취 감지 또는 로그아웃)."""
     await db.refreshtoken.delete_many(where={"userId": user_id})
+    invalidate_user_cache(user_id)
 
 async def revoke_token(token: str):
     """특정 Refresh Token 무효화 (로그아웃)."""
     rt = await db.refreshtoken.find_unique(where={"token": token})
     if rt:
         await db.refreshtoken.delete(where={"id": rt.id})
+        invalidate_user_cache(rt.userId)
+
+
+# ===== 사용자 캐시 =====
+
+def invalidate_user_cache(user_id: int) -> None:
+    """로그아웃/토큰 폐기/사용자 정보 변경 시 호출"""
+    _user_cache.pop(user_id, None)
+
+def _get_cached_user(user_id: int):
+    item = _user_cache.get(user_id)
+    if item is None:
+        return None
+    expires_at, user = item
+    if expires_at <= time.monotonic():
+        _user_cache.pop(user_id, None)
+        return None
+    return user
+
+def _cache_user(user_id: int, user) -> None:
+    if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+        # 가장 먼저 들어간 항목 제거 (dict 삽입 순서)
+        _user_cache.pop(next(iter(_user_cache)))
+    _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL_SECONDS, user)
 
 
 # ===== FastAPI Depends =====
@@ -102,10 +135,15 @@ async def revoke_token(token: str):
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Bearer Token에서 현재 사용자를 추출하는 FastAPI 의존성."""
     user_id = decode_access_token(credentials.credentials)
+    user = _get_cached_user(user_id)
+    if user is not None:
+        return user
+
     user = await db.user.find_unique(where={"id": user_id})
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자를 찾을 수 없습니다.",
         )
+    _cache_user(user_id, user)
     return user
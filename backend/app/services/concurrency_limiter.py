@@ -0,0 +1,89 @@
+from typing import Optional, Tuple, Type
+import asyncio
+import time
+
+
+class AIMDLimiter:
+    """
+    관측 결과에 따라 동시 실행 한도를 조절하는 Semaphore (AIMD: Additive Increase / Multiplicative Decrease).
+    - 성공 (+ 지연이 목표 이하): 한도 +increase (max_limit까지)
+    - 과부하 예외 또는 지연 초과: 한도 ×decrease (min_limit까지)
+    - 그 외 예외 (잘못된 요청, 안전 정책 등): 한도 유지
+    사용: async with limiter.slot(): ...
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target: Optional[float] = None,
+        overload_errors: Tuple[Type[BaseException], ...] = (),
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ):
+        self._limit = float(initial)
+        self._min = min_limit
+        self._max = max_limit
+        self._latency_target = latency_target
+        self._overload_errors = overload_errors
+        self._increase = increase
+        self._decrease = decrease
+        self._in_use = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_use < self.limit)
+            self._in_use += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._in_use -= 1
+            # 한도가 늘었을 수 있으므로 남은 permit 수만큼 깨움
+            self._cond.notify(max(1, self.limit - self._in_use))
+
+    def on_result(self, success: bool, latency: Optional[float] = None) -> None:
+        """호출 결과 반영. 늘어난 한도는 다음 release 시점에 대기 중인 acquire에 반영됨"""
+        slow = self._latency_target is not None and latency is not None and latency > self._latency_target
+        if success and not slow:
+            self._limit = min(float(self._max), self._limit + self._increase)
+        else:
+            self._limit = max(float(self._min), self._limit * self._decrease)
+
+    def slot(self) -> "_LimiterSlot":
+        """permit 1개를 잡고, 블록 종료 시 소요 시간/예외로 on_result를 자동 호출하는 컨텍스트"""
+        return _LimiterSlot(self)
+
+    def stats(self) -> dict:
+        limit = self.limit
+        return {"max": limit, "available": max(0, limit - self._in_use), "in_use": self._in_use}
+
+
+class _LimiterSlot:
+    def __init__(self, limiter: AIMDLimiter):
+        self._limiter = limiter
+        self._started_at = 0.0
+
+    async def __aenter__(self) -> "_LimiterSlot":
+        await self._limiter.acquire()
+        self._started_at = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        limiter = self._limiter
+        try:
+            if exc_type is None:
+                limiter.on_result(True, time.monotonic() - self._started_at)
+            elif limiter._overload_errors and issubclass(exc_type, limiter._overload_errors):
+                limiter.on_result(False)
+        finally:
+            await limiter.release()
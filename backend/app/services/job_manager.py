@@ -1,7 +1,39 @@
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
+import os
+import time
+
+import orjson
+
+# 인메모리 Job 보관 상한. 초과 시 DB에 기록된 오래된 완료/실패 Job부터 제거 (DB에서 다시 조회 가능)
+MAX_JOBS = 10000
+TERMINAL_STATUSES = ("completed", "failed")
+
+def new_job_id() -> str:
+    """
+    시간순 정렬 가능한 UUIDv7 문자열 생성 (RFC 9562).
+    상위 48비트가 ms 타임스탬프라 jobs.job_id 유니크 인덱스에 삽입 순서대로 쌓인다.
+    하이픈 없는 32자 hex 형태 (UUID 객체/__str__ 포맷팅 생략, 키 길이 축소).
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")  # 80비트 난수 (rand_a 12비트 + rand_b 62비트 + 여분)
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                               # version 7
+        | (rand >> 68) << 64                      # rand_a (12비트)
+        | 0b10 << 62                              # variant (RFC 4122)
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)          # rand_b (62비트)
+    )
+    return f"{value:032x}"
+
+@dataclass(frozen=True)
+class JobEvent:
+    """SSE로 전송할 상태 이벤트. payload는 상태 변경 시 한 번만 인코딩해 모든 구독자가 공유"""
+    status: str
+    payload: bytes  # UTF-8 JSON (orjson) — StreamingResponse에 그대로 전달
 
 @dataclass
 class JobInfo:
@@ -11,29 +43,99 @@ class JobInfo:
     result_url: Optional[str] = None
     error_message: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
-    _event: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    # jobs 테이블에 행이 있는 Job만 True → 인메모리에서 제거돼도 DB 폴백으로 복원 가능 (제거 대상)
+    persisted: bool = False
+    # SSE 구독자별 큐: update_job 시 JobEvent를 각 큐에 push (구독자마다 독립 backlog)
+    # 구독이 없는 대부분의 Job은 리스트를 만들지 않도록 첫 subscribe 시점에 생성
+    _subscribers: Optional[List[asyncio.Queue]] = field(default=None, repr=False)
+    # 현재 상태의 인코딩 결과 캐시 (상태 변경 시 무효화)
+    _latest: Optional[JobEvent] = field(default=None, repr=False)
+
+    def snapshot(self) -> dict:
+        """SSE / 상태 조회용 직렬화 가능한 상태 스냅샷"""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "asset_id": self.asset_id,
+            "result_url": self.result_url,
+            "error_message": self.error_message,
+        }
+
+    def latest_event(self) -> JobEvent:
+        """현재 상태의 JobEvent (같은 상태에 대해서는 JSON 인코딩을 한 번만 수행)"""
+        if self._latest is None:
+            self._latest = JobEvent(status=self.status, payload=orjson.dumps(self.snapshot()))
+        return self._latest
 
 class JobManager:
-    def __init__(self):
-        self._jobs: Dict[str, JobInfo] = {}
-        self._lock = asyncio.Lock()
+    """
+    인메모리 Job 상태 저장소.
+    모든 접근이 단일 이벤트 루프에서 await 없이 끝나므로 별도 Lock 없이 원자적으로 동작한다.
+    (메서드는 기존 호출부 호환을 위해 async 유지)
+    """
+
+    def __init__(self, max_jobs: int = MAX_JOBS):
+        self._max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, JobInfo]" = OrderedDict()
 
-    async def create_job(self, job_id: str) -> JobInfo:
-        async with self._lock:
-            job = JobInfo(job_id=job_id)
-            self._jobs[job_id] = job
-            return job
+    async def create_job(self, job_id: str, **kwargs) -> JobInfo:
+        """Job 등록. kwargs로 초기 상태를 지정하면 별도 update_job 없이 한 번에 생성"""
+        job = JobInfo(job_id=job_id, **kwargs)
+        self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        if len(self._jobs) > self._max_jobs:
+            self._evict()
+        return job
 
     async def update_job(self, job_id: str, **kwargs) -> None:
-        async with self._lock:
-            if job_id in self._jobs:
-                for key, value in kwargs.items():
-                    setattr(self._jobs[job_id], key, value)
-                self._jobs[job_id]._event.set()
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        for key, value in kwargs.items():
+            setattr(job, key, value)
+        job._latest = None
+        if job._subscribers:
+            event = job.latest_event()
+            for queue in job._subscribers:
+                queue.put_nowait(event)
 
     async def get_job(self, job_id: str) -> Optional[JobInfo]:
         return self._jobs.get(job_id)
 
+    def _evict(self) -> None:
+        """
+        상한 초과분 제거: 오래된 완료/실패 Job 우선, 없으면 가장 오래된 Job.
+        SSE 구독 중인 Job과 DB에 행이 없는(복원 불가) Job은 제거하지 않는다.
+        """
+        while len(self._jobs) > self._max_jobs:
+            fallback = None
+            for job_id, job in self._jobs.items():
+                if job._subscribers or not job.persisted:
+                    continue
+                if job.status in TERMINAL_STATUSES:
+                    break
+                if fallback is None:
+                    fallback = job_id
+            else:
+                if fallback is None:
+                    return
+                job_id = fallback
+            del self._jobs[job_id]
+
+    def subscribe(self, job: JobInfo) -> asyncio.Queue:
+        """상태 변화 알림을 받을 구독 큐 등록 (SSE 연결당 1개)"""
+        queue: asyncio.Queue = asyncio.Queue()
+        if job._subscribers is None:
+            job._subscribers = []
+        job._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, job: JobInfo, queue: asyncio.Queue) -> None:
+        if job._subscribers and queue in job._subscribers:
+            job._subscribers.remove(queue)
+            if not job._subscribers:
+                job._subscribers = None
+
     def get_stats(self) -> Dict[str, int]:
         """Job 상태별 집계 반환"""
         stats = {"pending": 0, "processing": 0, "completed": 0, "failed": 0}
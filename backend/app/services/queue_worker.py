@@ -1,14 +1,14 @@
 import asyncio
-import json
+import orjson
 import os
 import logging
 from datetime import datetime, timedelta, timezone
-
-import aiofiles
+from pathlib import Path
 
 from app.db import db
 from app.services.job_manager import job_manager
-from app.services.vertex_ai import vertex_ai_service
+from app.services.asset_cache import asset_cache, normalize_prompt, prompt_hash
+from app.services.vertex_ai import get_vertex_ai_service
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -58,10 +58,13 @@ class QueueWorker:
 
     async def _recover_from_db(self):
         """서버 재시작 시 DB에서 미완료 작업 복구"""
-        processing_jobs = await db.job.find_many(where={"status": "processing"})
-        for job in processing_jobs:
-            await db.job.update(where={"id": job.id}, data={"status": "queued"})
-            logger.info(f"[Recovery] Reset processing -> queued: {job.jobId}")
+        # 중단된 processing 작업을 한 번의 UPDATE로 queued 복귀
+        reset_count = await db.job.update_many(
+            where={"status": "processing"},
+            data={"status": "queued"},
+        )
+        if reset_count:
+            logger.info(f"[Recovery] Reset {reset_count} processing -> queued")
 
         queued_jobs = await db.job.find_many(
             where={"status": "queued"},
@@ -70,7 +73,7 @@ class QueueWorker:
         for job in queued_jobs:
             existing = await job_manager.get_job(job.jobId)
             if not existing:
-                await job_manager.create_job(job.jobId)
+                await job_manager.create_job(job.jobId, persisted=True)
             await self._queue.put(job.jobId)
 
         if queued_jobs:
@@ -79,28 +82,23 @@ class QueueWorker:
     async def _cleanup_zombie_jobs(self):
         """24시간 이상 processing 상태인 좀비 작업을 failed로 처리"""
         threshold = datetime.now(timezone.utc) - timedelta(hours=ZOMBIE_THRESHOLD_HOURS)
-        zombie_jobs = await db.job.find_many(
+        zombie_count = await db.job.update_many(
             where={"status": "processing", "updatedAt": {"lt": threshold}},
+            data={
+                "status": "failed",
+                "errorMessage": f"좀비 작업: {ZOMBIE_THRESHOLD_HOURS}시간 이상 처리 중 상태로 방치됨",
+            },
         )
-        for job in zombie_jobs:
-            await db.job.update(
-                where={"id": job.id},
-                data={
-                    "status": "failed",
-                    "errorMessage": f"좀비 작업: {ZOMBIE_THRESHOLD_HOURS}시간 이상 처리 중 상태로 방치됨",
-                },
-            )
-            logger.warning(f"[Zombie] Marked as failed: {job.jobId}")
+        if zombie_count:
+            logger.warning(f"[Zombie] Marked {zombie_count} jobs as failed")
 
     async def _worker_loop(self, worker_id: int):
         """Worker 코루틴: 큐에서 작업을 꺼내 처리"""
         logger.info(f"[Worker-{worker_id}] Started")
         while self._running:
             try:
-                try:
-                    job_id = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    continue
+                # 작업이 올 때까지 대기 (폴링 타임아웃 없음 — stop()의 cancel로 종료)
+                job_id = await self._queue.get()
 
                 logger.info(f"[Worker-{worker_id}] Processing job {job_id}")
                 await self._process_job(job_id, worker_id)
@@ -123,16 +121,27 @@ class QueueWorker:
             logger.warning(f"[Worker-{worker_id}] Job {job_id} status is '{db_job.status}', skipping")
             return
 
-        options = json.loads(db_job.options) if db_job.options else {}
+        options = orjson.loads(db_job.options) if db_job.options else {}
+        # Asset.prompt / 캐시 키용 정규화는 Job당 한 번만 수행
+        normalized_prompt = normalize_prompt(db_job.prompt)
 
         try:
+            # SSE 구독자에게는 DB 왕복을 기다리지 않고 즉시 processing 전파.
+            # DB processing 기록은 재시작 복구(_recover_from_db)와 좀비 정리, admin 통계가 사용하므로 유지
+            await job_manager.update_job(job_id, status="processing")
+            await db.job.update(where={"jobId": job_id}, data={"status": "processing"})
+
             if db_job.jobType == "text-to-image":
-                await self._process_image(job_id, db_job.prompt, db_job.model, db_job.userId, options)
+                await self._process_image(
+                    job_id, db_job.prompt, normalized_prompt, db_job.model, db_job.userId, options,
+                )
             elif db_job.jobType == "text-to-video":
-                await self._process_video_text(job_id, db_job.prompt, db_job.model, db_job.userId, options)
+                await self._process_video_text(
+                    job_id, db_job.prompt, normalized_prompt, db_job.model, db_job.userId, options,
+                )
             elif db_job.jobType == "image-to-video":
                 await self._process_video_image(
-                    job_id, db_job.prompt, db_job.model, db_job.userId,
+                    job_id, db_job.prompt, normalized_prompt, db_job.model, db_job.userId,
                     db_job.imagePath, db_job.mimeType or "image/png", options,
                 )
             else:
@@ -143,78 +152,59 @@ class QueueWorker:
             await db.job.update(where={"jobId": job_id}, data={"status": "failed", "errorMessage": error_msg})
             await job_manager.update_job(job_id, status="failed", error_message=error_msg)
 
-    async def _process_image(self, job_id: str, prompt: str, model: str, user_id: int, options: dict):
-        await db.job.update(where={"jobId": job_id}, data={"status": "processing"})
-        await job_manager.update_job(job_id, status="processing")
-
-        result_url = await vertex_ai_service.generate_image(prompt, job_id, options=options or None)
-
-        normalized_prompt = prompt.strip().lower()
-        asset = await db.asset.create(data={
-            "jobId": job_id,
-            "filePath": result_url,
-            "prompt": normalized_prompt,
-            "model": model,
-            "assetType": "image",
-            "userId": user_id,
-        })
-
-        await db.job.update(
-            where={"jobId": job_id},
-            data={"status": "completed", "assetId": asset.id, "resultUrl": result_url},
-        )
-        await job_manager.update_job(job_id, status="completed", asset_id=asset.id, result_url=result_url)
+    async def _process_image(self, job_id: str, prompt: str, normalized_prompt: str, model: str,
+                             user_id: int, options: dict):
+        result_url = await get_vertex_ai_service().generate_image(prompt, job_id, options=options or None)
 
-    async def _process_video_text(self, job_id: str, prompt: str, model: str, user_id: int, options: dict):
-        await db.job.update(where={"jobId": job_id}, data={"status": "processing"})
-        await job_manager.update_job(job_id, status="processing")
-
-        result_url = await vertex_ai_service.generate_video_from_text(prompt, job_id, options=options or None)
-
-        normalized_prompt = prompt.strip().lower()
-        asset = await db.asset.create(data={
-            "jobId": job_id,
-            "filePath": result_url,
-            "prompt": normalized_prompt,
-            "model": model,
-            "assetType": "video",
-            "userId": user_id,
-        })
-
-        await db.job.update(
-            where={"jobId": job_id},
-            data={"status": "completed", "assetId": asset.id, "resultUrl": result_url},
-        )
-        await job_manager.update_job(job_id, status="completed", asset_id=asset.id, result_url=result_url)
+        await self._complete_job(job_id, result_url, normalized_prompt, model, "image", user_id)
 
-    async def _process_video_image(self, job_id: str, prompt: str, model: str, user_id: int,
-                                    image_path: str, mime_type: str, options: dict):
-        await db.job.update(where={"jobId": job_id}, data={"status": "processing"})
-        await job_manager.update_job(job_id, status="processing")
+    async def _process_video_text(self, job_id: str, prompt: str, normalized_prompt: str, model: str,
+                                  user_id: int, options: dict):
+        result_url = await get_vertex_ai_service().generate_video_from_text(prompt, job_id, options=options or None)
 
-        async with aiofiles.open(image_path, "rb") as f:
-            image_bytes = await f.read()
+        await self._complete_job(job_id, result_url, normalized_prompt, model, "video", user_id)
 
-        result_url = await vertex_ai_service.generate_video_from_image(
-            prompt, image_bytes, job_id, mime_type, options=options or None,
-        )
+    async def _process_video_image(self, job_id: str, prompt: str, normalized_prompt: str, model: str,
+                                    user_id: int, image_path: str, mime_type: str, options: dict):
+        try:
+            # open/read/close를 스레드풀 한 번 왕복으로 처리
+            image_bytes = await asyncio.to_thread(Path(image_path).read_bytes)
 
-        normalized_prompt = prompt.strip().lower()
-        asset = await db.asset.create(data={
-            "jobId": job_id,
-            "filePath": result_url,
-            "prompt": normalized_prompt,
-            "model": model,
-            "assetType": "video",
-            "userId": user_id,
-        })
-
-        await db.job.update(
-            where={"jobId": job_id},
-            data={"status": "completed", "assetId": asset.id, "resultUrl": result_url},
-        )
+            result_url = await get_vertex_ai_service().generate_video_from_image(
+                prompt, image_bytes, job_id, mime_type, options=options or None,
+            )
+        except Exception:
+            # 실패한 Job의 임시 이미지도 정리 (취소 시에는 재시작 복구를 위해 보존)
+            self._remove_temp_image(image_path)
+            raise
+
+        await self._complete_job(job_id, result_url, normalized_prompt, model, "video", user_id)
+
+        self._remove_temp_image(image_path)
+
+    async def _complete_job(self, job_id: str, result_url: str, normalized_prompt: str, model: str,
+                            asset_type: str, user_id: int):
+        """에셋 생성 + Job 완료 기록을 하나의 트랜잭션으로 처리 (에셋만 있고 Job은 미완료인 상태 방지)"""
+        async with db.tx() as tx:
+            asset = await tx.asset.create(data={
+                "jobId": job_id,
+                "filePath": result_url,
+                "prompt": normalized_prompt,
+                "promptHash": prompt_hash(normalized_prompt),
+                "model": model,
+                "assetType": asset_type,
+                "userId": user_id,
+            })
+            await tx.job.update(
+                where={"jobId": job_id},
+                data={"status": "completed", "assetId": asset.id, "resultUrl": result_url},
+            )
+
+        asset_cache.put(normalized_prompt, model, asset_type, asset.id, result_url)
         await job_manager.update_job(job_id, status="completed", asset_id=asset.id, result_url=result_url)
 
+    @staticmethod
+    def _remove_temp_image(image_path: str):
         try:
             os.remove(image_path)
             logger.info(f"[Worker] Deleted temp image: {image_path}")
@@ -0,0 +1,51 @@
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional
+import time
+
+
+class RateLimiter:
+    """
+    키(사용자 ID)별 슬라이딩 윈도우 요청 제한 (프로세스 내 메모리).
+    window_seconds 동안 limit회를 넘는 요청은 거부한다. limit <= 0이면 제한 없음.
+    """
+
+    def __init__(self, limit: int, window_seconds: float = 60.0):
+        self._limit = limit
+        self._window = window_seconds
+        self._hits: Dict[Hashable, Deque[float]] = {}
+        # 윈도우마다 1번, 윈도우 안에 요청이 없는 키를 정리 (요청을 멈춘 사용자의 기록이 계속 쌓이지 않도록)
+        self._next_sweep = time.monotonic() + window_seconds
+
+    def hit(self, key: Hashable) -> Optional[float]:
+        """요청 1회 기록. 허용되면 None, 초과 시 다음 요청 가능까지 남은 초를 반환"""
+        if self._limit <= 0:
+            return None
+
+        now = time.monotonic()
+        cutoff = now - self._window
+        if now >= self._next_sweep:
+            self._sweep(cutoff)
+            self._next_sweep = now + self._window
+
+        hits = self._hits.get(key)
+        if hits is None:
+            self._hits[key] = deque([now])
+            return None
+
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+
+        if len(hits) >= self._limit:
+            return hits[0] + self._window - now
+
+        hits.append(now)
+        return None
+
+    def _sweep(self, cutoff: float) -> None:
+        """마지막 요청이 윈도우 밖인 키 제거 (저장된 deque는 항상 1개 이상의 기록을 가짐)"""
+        idle = [key for key, hits in self._hits.items() if hits[-1] <= cutoff]
+        for key in idle:
+            del self._hits[key]
+
+    def reset(self) -> None:
+        self._hits.clear()
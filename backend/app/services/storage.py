@@ -0,0 +1,17 @@
+from pathlib import Path
+from typing import Optional
+
+STORAGE_URL_PREFIX = "/storage/"
+
+
+def resolve_storage_path(file_url: str, storage_root: str) -> Optional[Path]:
+    """
+    /storage/... URL(Asset.filePath)을 storage_root 기준 절대 경로로 변환.
+    storage_root 밖을 가리키는 경로(path traversal)면 None 반환.
+    resolve()/traversal 검사 결과는 파일시스템 상태(심볼릭 링크)에 따라 바뀌므로 캐시하지 않는다.
+    """
+    root = Path(storage_root).resolve()
+    file_path = (root / file_url.removeprefix(STORAGE_URL_PREFIX)).resolve()
+    if not file_path.is_relative_to(root):
+        return None
+    return file_path
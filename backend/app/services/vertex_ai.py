@@ -1,21 +1,30 @@
 import os
+import re
 import asyncio
 import base64
 import time
+import functools
+import math
+import importlib.util
 import random
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timezone
 
-import aiofiles
 import httpx
+import orjson
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
     before_sleep_log,
 )
 
 from app.config import get_settings
+from app.services.concurrency_limiter import AIMDLimiter
+from app.services.rate_limiter import RateLimiter
 
 # Mock 모드: LOAD_TEST_MODE=true 일 때 Vertex AI 호출을 asyncio.sleep으로 대체
 LOAD_TEST_MODE = os.environ.get("LOAD_TEST_MODE", "").lower() == "true"
@@ -38,26 +47,229 @@ VERTEX_AI_SCOPES = [
     "https://www.googleapis.com/auth/cloud-platform",
 ]
 
-# LRO Polling 설정
-LRO_POLL_INTERVAL = 10  # 10초마다 상태 확인
+# Vertex AI REST 호출용 공유 HTTP 클라이언트 설정 (워커 간 커넥션 풀 재사용)
+HTTP_TIMEOUT = 60.0
+HTTP_POLL_TIMEOUT = 30.0
+# keepalive_expiry: 기본값(5초)이면 LRO 폴링 간격(최대 10초) 사이에 유휴 커넥션이 닫혀 매번 TLS 재협상
+HTTP_KEEPALIVE_EXPIRY = 75.0
+HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+)
+HTTP_CONNECT_RETRIES = 3  # 연결 단계(DNS/TCP/TLS) 실패는 transport에서 바로 재시도
+# HTTP/2: 동시 폴링/시작 요청을 호스트당 커넥션 1개에 멀티플렉싱 (httpx[http2] extra의 h2 패키지가 있을 때만)
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# 선제적 쿼터 제어: 응답의 rate-limit 헤더에서 남은 요청이 10% 미만이면 다음 호출 전 잠시 대기
+# (remaining 헤더, limit 헤더) — 제공자/프록시별 표기 차이
+RATE_LIMIT_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-limit-requests"),
+    ("x-ratelimit-remaining", "x-ratelimit-limit"),
+    ("ratelimit-remaining", "ratelimit-limit"),
+)
+RATE_LIMIT_LOW_RATIO = 0.1
+RATE_LIMIT_DEFAULT_PAUSE = 2.0  # Retry-After가 없을 때 대기 시간(초)
+
+# 액세스 토큰 캐시: 만료 60초 전부터 백그라운드 갱신 (갱신 HTTP 호출은 이벤트 루프 밖에서)
+# 남은 유효 시간이 TOKEN_MIN_REMAINING 미만일 때만 요청이 갱신 완료를 기다림
+TOKEN_REFRESH_MARGIN = 60
+TOKEN_MIN_REMAINING = 10
+
+# LRO Polling 설정: 1초에서 시작해 1.7배씩 늘리되 최대 10초 (서버 Retry-After가 있으면 우선)
+LRO_POLL_INITIAL_INTERVAL = 1.0
+LRO_POLL_MAX_INTERVAL = 10.0
+LRO_POLL_BACKOFF = 1.7
 LRO_MAX_WAIT_TIME = 600  # 최대 10분 대기
 
-# Rate Limit 제어용 Semaphore
+# Rate Limit 제어용 동시 실행 한도 (AIMD: 성공 시 +1, 429/5xx 시 절반으로)
 # Vertex AI Rate Limit: 이미지 60회/분, 비디오 10회/분
-IMAGE_SEMAPHORE = asyncio.Semaphore(10)  # 이미지 동시 최대 10개
-VIDEO_SEMAPHORE = asyncio.Semaphore(3)   # 비디오 동시 최대 3개
+# kind → (초기, 최소, 최대, 목표 지연[초] — 넘으면 과부하로 간주, None이면 지연 무시)
+CONCURRENCY_LIMITS = {
+    "image": (10, 2, 20, 30.0),
+    "video": (3, 1, 6, None),  # 비디오는 LRO 시작 요청에만 적용 (폴링은 한도 밖), 지연은 과부하 신호로 쓰지 않음
+}
+
+# 같은 프롬프트/옵션의 동시 Imagen 요청을 SDK 호출 1회(number_of_images=N)로 합칠 최대 요청 수
+IMAGEN_COALESCE_MAX = 4
+IMAGEN_BLOCKED_MESSAGE = "생성된 이미지가 안전 정책(폭력, 선정성 등)에 의해 차단되었습니다. 프롬프트를 수정한 후 다시 시도해 주세요."
+
+
+# LOAD_TEST_MODE 더미 결과물: kind → (저장 하위 디렉터리, 확장자, 로그 태그)
+_MOCK_OUTPUTS = {
+    "image": ("images", "png", "Imagen"),
+    "video": ("videos", "mp4", "Veo"),
+}
+
+
+def _write_bytes(file_path: str, data: bytes) -> None:
+    """
+    결과 파일 저장 (to_thread에서 호출).
+    open/write/close를 스레드풀 한 번 왕복으로 처리 (aiofiles는 단계마다 왕복)
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as f:
+        f.write(data)
+
+
+def _quota_pause_seconds(response: httpx.Response) -> float | None:
+    """
+    응답으로 본 쿼터 상태에 따라 다음 호출 전 대기할 초.
+    429이거나 남은 요청이 limit의 10% 미만이면 Retry-After(없으면 기본값), 여유 있으면 None
+    """
+    headers = response.headers
+    low = response.status_code == 429
+    if not low:
+        for remaining_key, limit_key in RATE_LIMIT_HEADERS:
+            remaining, limit = headers.get(remaining_key), headers.get(limit_key)
+            if remaining is None or limit is None:
+                continue
+            try:
+                low = float(limit) > 0 and float(remaining) / float(limit) < RATE_LIMIT_LOW_RATIO
+            except ValueError:
+                pass
+            break
+    if not low:
+        return None
+    retry_after = _parse_retry_after(headers.get("Retry-After"))
+    return retry_after if retry_after is not None else RATE_LIMIT_DEFAULT_PAUSE
+
+
+# 에러 메시지/로그에 넣을 응답 본문 최대 길이 (본문 전체를 str로 만들지 않도록)
+ERROR_BODY_MAX_CHARS = 500
+
+
+def _error_body(response: httpx.Response) -> str:
+    """실패 응답 본문 앞부분만 디코딩"""
+    return response.content[:ERROR_BODY_MAX_CHARS].decode(response.encoding or "utf-8", errors="replace")
+
+
+def _encode_base64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+# LRO 결과에서 비디오(bytesBase64Encoded를 가진 dict)를 찾는 경로 — 앞쪽부터 우선 탐색
+_VIDEO_PATHS = (
+    ("predictions", 0),                 # predictions[0].bytesBase64Encoded
+    ("predictions", 0, "video"),        # predictions[0].video.bytesBase64Encoded
+    ("videos", 0),                      # videos[0] (GenerateVideoResponse 형식)
+    ("generatedSamples", 0, "video"),   # generatedSamples[0].video
+    ("video",),                         # result.video
+)
+
+def _walk(data, path: tuple):
+    """dict/list를 path대로 따라가 값 반환. 중간에 키/인덱스가 없으면 None"""
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+def _format_path(path: tuple) -> str:
+    return "".join(f"[{k}]" if isinstance(k, int) else f".{k}" for k in path).lstrip(".")
+
+
+# base64 디코딩 단위 (4의 배수여야 조각별 디코딩 결과를 이어 붙이면 전체 디코딩과 같음)
+VIDEO_DECODE_CHUNK = 4 * 64 * 1024
+
+
+def _decode_and_write(file_path: str, encoded: str) -> None:
+    """
+    base64 비디오를 조각 단위로 디코딩해 파일로 저장 (to_thread에서 호출).
+    디코딩된 전체 bytes를 한 번에 만들지 않아 base64 문자열 외에 영상 크기만큼의 사본이 생기지 않음
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as f:
+        for i in range(0, len(encoded), VIDEO_DECODE_CHUNK):
+            f.write(base64.b64decode(encoded[i:i + VIDEO_DECODE_CHUNK]))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 단위 숫자)를 float로 변환. 없거나 HTTP-date 형식이거나 inf/nan이면 None"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
 
 
 # ===== 재시도용 커스텀 예외 =====
 
 class RetryableAPIError(Exception):
     """429 (Rate Limit), 503 (Service Unavailable) 등 재시도 가능한 에러"""
-    pass
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # 서버가 준 Retry-After(초), 없으면 None
 
 class NonRetryableAPIError(Exception):
     """400 (Bad Request) 등 재시도해도 의미 없는 에러"""
     pass
 
+# 서버 Retry-After를 따르는 재시도 대기 상한 (큰 값이 와도 워커와 Job이 그만큼 묶이지 않도록)
+RETRY_AFTER_MAX_WAIT = 60.0
+
+def _wait_retry_after_or(fallback):
+    """
+    tenacity wait: 예외에 서버 Retry-After가 있으면 그 시간만큼(최대 RETRY_AFTER_MAX_WAIT), 없으면 fallback(지터 포함 지수 백오프).
+    동시에 실패한 요청들이 같은 시점에 재시도해 다시 충돌하지 않도록 fallback에는 랜덤 지터를 쓴다.
+    """
+    def wait(retry_state) -> float:
+        retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, RETRY_AFTER_MAX_WAIT)
+        return fallback(retry_state)
+    return wait
+
+def _make_limiter(kind: str) -> AIMDLimiter:
+    initial, min_limit, max_limit, latency_target = CONCURRENCY_LIMITS[kind]
+    return AIMDLimiter(
+        initial, min_limit, max_limit,
+        latency_target=latency_target,
+        overload_errors=(RetryableAPIError,),
+    )
+
+IMAGE_LIMITER = _make_limiter("image")  # 이미지 동시 10개에서 시작 (2~20)
+VIDEO_LIMITER = _make_limiter("video")  # 비디오 동시 3개에서 시작 (1~6)
+
+
+# 분당 요청 수 제한 (동시 실행 한도와 별개): 429 이후 재시도가 몰려도 실제 호출은 쿼터 속도를 넘지 않음
+IMAGE_RATE_LIMITER = RateLimiter(settings.vertex_image_requests_per_minute, window_seconds=60)
+VIDEO_RATE_LIMITER = RateLimiter(settings.vertex_video_requests_per_minute, window_seconds=60)
+
+
+async def _wait_for_rate(limiter: RateLimiter) -> None:
+    """분당 요청 한도에 걸리면 윈도우에 자리가 날 때까지 대기 후 1회 기록"""
+    while (wait := limiter.hit("vertex")) is not None:
+        await asyncio.sleep(wait)
+
+
+def get_concurrency_stats() -> dict:
+    """동시 실행 제한 현황 스냅샷 (admin 모니터링용) — max는 AIMD가 조정한 현재 한도"""
+    return {"image": IMAGE_LIMITER.stats(), "video": VIDEO_LIMITER.stats()}
+
+
+# Vertex AI REST 커넥션 풀 사용 현황 (프로세스 누적): 요청 수 대비 새 TCP 연결 수로 keep-alive 재사용 여부 확인
+# http_version은 마지막 응답에서 협상된 프로토콜 (HTTP/2 적용 여부 확인용)
+_HTTP_POOL_STATS = {"requests": 0, "new_connections": 0, "http_version": None}
+
+
+def get_http_pool_stats() -> dict:
+    """커넥션 풀 재사용 현황 스냅샷 (admin 모니터링용) — reused는 기존 커넥션으로 처리된 요청 수"""
+    requests, new_connections = _HTTP_POOL_STATS["requests"], _HTTP_POOL_STATS["new_connections"]
+    return {
+        "requests": requests,
+        "new_connections": new_connections,
+        "reused": max(0, requests - new_connections),
+        "http2_enabled": HTTP2_ENABLED,
+        "http_version": _HTTP_POOL_STATS["http_version"],
+    }
+
 # 서비스 계정 파일 경로
 SERVICE_ACCOUNT_FILE = os.environ.get(
     "GOOGLE_APPLICATION_CREDENTIALS",
@@ -65,6 +277,15 @@ SERVICE_ACCOUNT_FILE = os.environ.get(
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _load_credentials():
+    """서비스 계정 인증 정보 로드 (스코프 포함). 파일 읽기/파싱은 프로세스당 1회"""
+    return service_account.Credentials.from_service_account_file(
+        SERVICE_ACCOUNT_FILE,
+        scopes=VERTEX_AI_SCOPES
+    )
+
+
 # ===== Vertex AI 안전 정책 에러 → 한글 변환 =====
 
 _SAFETY_PATTERNS = [
@@ -81,34 +302,108 @@ _SAFETY_PATTERNS = [
     ("blocked", "콘텐츠 정책에 의해 차단되었습니다."),
 ]
 
+# 패턴 전체를 하나의 정규식으로 컴파일 (그룹 이름 g{i} = _SAFETY_PATTERNS 인덱스 = 우선순위)
+_SAFETY_RE = re.compile(
+    "|".join(f"(?P<g{i}>{re.escape(pattern)})" for i, (pattern, _) in enumerate(_SAFETY_PATTERNS)),
+    re.IGNORECASE,
+)
+_SAFETY_MESSAGES = [f"{korean_msg} 프롬프트를 수정한 후 다시 시도해 주세요." for _, korean_msg in _SAFETY_PATTERNS]
+
 def _to_korean_safety_message(error_msg: str) -> str | None:
     """
     Vertex AI 에러 메시지에서 안전 정책 관련 패턴을 감지하여 한글로 변환.
     안전 정책과 무관한 에러이면 None을 반환.
+    메시지를 한 번만 훑고, 여러 패턴이 나오면 목록 앞쪽(더 구체적인) 패턴을 우선한다.
     """
-    lower = error_msg.lower()
-    for pattern, korean_msg in _SAFETY_PATTERNS:
-        if pattern in lower:
-            return f"{korean_msg} 프롬프트를 수정한 후 다시 시도해 주세요."
-    return None
+    index = min((int(m.lastgroup[1:]) for m in _SAFETY_RE.finditer(error_msg)), default=None)
+    if index is None:
+        return None
+    return _SAFETY_MESSAGES[index]
+
+
+class _PoolStatsTransport(httpx.AsyncHTTPTransport):
+    """요청마다 httpcore trace 이벤트로 새 TCP 연결 여부를 집계하는 transport"""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        _HTTP_POOL_STATS["requests"] += 1
+        parent_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                _HTTP_POOL_STATS["new_connections"] += 1
+            if parent_trace is not None:
+                await parent_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        response = await super().handle_async_request(request)
+
+        http_version = response.extensions.get("http_version", b"").decode("ascii") or None
+        if http_version != _HTTP_POOL_STATS["http_version"]:
+            # 협상 결과가 바뀔 때만 로깅 (보통 프로세스당 1회)
+            _HTTP_POOL_STATS["http_version"] = http_version
+            if HTTP2_ENABLED and http_version != "HTTP/2":
+                logger.warning("[VertexAI] HTTP/2 enabled but %s negotiated with %s", http_version, request.url.host)
+            else:
+                logger.info("[VertexAI] %s negotiated with %s", http_version, request.url.host)
+        return response
+
+
+class _BearerAuth(httpx.Auth):
+    """
+    공유 클라이언트용 인증: 요청 전송 시점에 캐시된 "Bearer ..." 헤더를 붙인다.
+    토큰이 만료 임박이면 서비스의 비동기 갱신을 거친다.
+    """
+
+    def __init__(self, service: "VertexAIService"):
+        self._service = service
+
+    async def async_auth_flow(self, request: httpx.Request):
+        request.headers["Authorization"] = await self._service._get_auth_header()
+        yield request
+
+
+@dataclass
+class _PendingOperation:
+    """백그라운드 poller가 추적하는 진행 중 Veo LRO 1건"""
+    future: asyncio.Future
+    started_at: float
+    next_poll_at: float
+    delay: float = LRO_POLL_INITIAL_INTERVAL
 
 
 class VertexAIService:
     def __init__(self):
+        # 첫 REST 호출 시 생성 → 이후 모든 Veo 요청이 같은 커넥션 풀(keep-alive)을 공유
+        self._http_client: httpx.AsyncClient | None = None
+        # 진행 중 LRO: operation_name → 완료 시 결과를 받을 Future (poller 1개가 전부 폴링)
+        self._pending: dict[str, _PendingOperation] = {}
+        self._poller_task: asyncio.Task | None = None
+        # 새 Operation 등록 시 긴 간격으로 대기 중인 poller를 깨우는 이벤트 (poller 시작 시 생성)
+        self._poller_wakeup: asyncio.Event | None = None
+        # 캐시된 액세스 토큰과 만료 시각(epoch 초)
+        self._token: str | None = None
+        self._auth_header = ""  # 갱신 시 한 번만 만드는 "Bearer {token}" 문자열
+        self._token_expiry = 0.0
+        self._token_lock = asyncio.Lock()
+        self._token_refresh_task: asyncio.Task | None = None
+        # 쿼터 소진 임박 시 Veo 호출을 멈춰둘 시각 (monotonic, 모든 워커 공유)
+        self._veo_paused_until = 0.0
+        # Imagen SDK 전용 스레드 풀 (실제 모드에서만 생성, aclose에서 종료)
+        self._imagen_executor: ThreadPoolExecutor | None = None
+        # 진행 중인 Imagen 호출에 합류 대기 중인 요청: SDK kwargs 키 → 이미지를 나눠 받을 Future 목록
+        self._imagen_batches: dict[bytes, list[asyncio.Future]] = {}
+        # 마지막으로 비디오를 찾은 _VIDEO_PATHS 경로 (응답 형식이 고정이라 다음부터 이 경로를 먼저 확인)
+        self._video_path: tuple | None = None
+
         if LOAD_TEST_MODE:
             # Mock 모드: GCP 인증/SDK 초기화 건너뛰기
-            logger.info("[VertexAI] LOAD_TEST_MODE enabled — skipping GCP auth")
-            print("[VertexAI] LOAD_TEST_MODE enabled — using mock generation")
+            logger.info("[VertexAI] LOAD_TEST_MODE enabled — skipping GCP auth, using mock generation")
             return
 
         self.project = settings.google_cloud_project
         self.location = settings.google_cloud_region
 
-        # 서비스 계정 인증 정보 로드 (스코프 포함)
-        self.credentials = service_account.Credentials.from_service_account_file(
-            SERVICE_ACCOUNT_FILE,
-            scopes=VERTEX_AI_SCOPES
-        )
+        self.credentials = _load_credentials()
 
         # Vertex AI 초기화 (Imagen용)
         vertexai.init(
@@ -118,23 +413,114 @@ class VertexAIService:
         )
 
         self.image_model = ImageGenerationModel.from_pretrained(IMAGEN_MODEL)
+        # Imagen SDK 호출(블로킹) 전용 스레드 풀: 파일 쓰기/디코딩 등 기본 executor 작업과 경쟁하지 않도록
+        # 이미지 동시 실행 한도의 최대값만큼 확보해 슬롯을 얻은 요청은 항상 스레드를 바로 사용
+        self._imagen_executor = ThreadPoolExecutor(
+            max_workers=CONCURRENCY_LIMITS["image"][2],
+            thread_name_prefix="imagen",
+        )
 
         # Veo API 엔드포인트 (REST API)
         self.veo_base_url = f"https://{self.location}-aiplatform.googleapis.com/v1"
         self.veo_endpoint = f"projects/{self.project}/locations/{self.location}/publishers/google/models/{VEO_MODEL}"
+        # 배포 설정이 고정이라 호출 URL은 한 번만 만든다
+        self.veo_predict_url = f"{self.veo_base_url}/{self.veo_endpoint}:predictLongRunning"
+        self.veo_fetch_url = f"{self.veo_base_url}/{self.veo_endpoint}:fetchPredictOperation"
+
+        logger.info(f"[VertexAI] Initialized with project={self.project}, location={self.location}")
+        logger.info(f"[VertexAI] Service account: {SERVICE_ACCOUNT_FILE}")
+
+    async def _mock_generate(self, kind: str, job_id: str, delay_range: tuple[float, float]) -> str:
+        """LOAD_TEST_MODE 전용: API 지연을 sleep으로 흉내 내고 더미 파일 저장 후 URL 반환"""
+        sub_dir, ext, tag = _MOCK_OUTPUTS[kind]
+        await asyncio.sleep(random.uniform(*delay_range))
+        file_name = f"{job_id}.{ext}"
+        file_path = os.path.join(settings.storage_path, sub_dir, file_name)
+        await asyncio.to_thread(_write_bytes, file_path, f"mock-{kind}-data".encode())
+        logger.info(f"[{tag}] Mock generation completed for job {job_id}")
+        return f"/storage/{sub_dir}/{file_name}"
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """공유 AsyncClient 반환 (요청마다 새 TLS 핸드셰이크를 하지 않도록)"""
+        if self._http_client is None or self._http_client.is_closed:
+            # 연결 실패는 transport가 재시도하고, tenacity는 429/5xx 응답 재시도만 담당
+            if not HTTP2_ENABLED:
+                logger.warning("[VertexAI] h2 package not installed — Vertex AI REST calls fall back to HTTP/1.1")
+            transport = _PoolStatsTransport(limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES, http2=HTTP2_ENABLED)
+            self._http_client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT,
+                transport=transport,
+                auth=_BearerAuth(self),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """앱 종료 시 LRO poller 중지 + 공유 HTTP 클라이언트의 커넥션 정리 + Imagen 스레드 풀 종료"""
+        if self._poller_task is not None:
+            self._poller_task.cancel()
+            await asyncio.gather(self._poller_task, return_exceptions=True)
+            self._poller_task = None
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+            await asyncio.gather(self._token_refresh_task, return_exceptions=True)
+            self._token_refresh_task = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._imagen_executor is not None:
+            # 진행 중인 SDK 호출은 끝까지 기다리지 않음 (이미 종료 단계)
+            self._imagen_executor.shutdown(wait=False, cancel_futures=True)
+            self._imagen_executor = None
+
+    async def _get_auth_token(self) -> str:
+        """
+        인증 토큰 가져오기 (캐시 + 만료 전 갱신).
+        만료가 임박해도 아직 유효하면 현재 토큰을 그대로 쓰고 갱신은 백그라운드 task로 넘긴다
+        (stale-while-revalidate). 토큰이 없거나 거의 만료된 경우에만 갱신 완료를 기다린다.
+        """
+        now = time.time()
+        if self._token and now < self._token_expiry - TOKEN_REFRESH_MARGIN:
+            return self._token
+
+        if self._token and now < self._token_expiry - TOKEN_MIN_REMAINING:
+            if self._token_refresh_task is None or self._token_refresh_task.done():
+                self._token_refresh_task = asyncio.create_task(self._refresh_token_in_background())
+            return self._token
+
+        await self._refresh_token()
+        return self._token
+
+    async def _refresh_token(self) -> None:
+        """토큰 갱신 — 네트워크 호출이라 스레드에서 실행하고, 동시 갱신은 Lock으로 1회로 합친다"""
+        async with self._token_lock:
+            if not self._token or time.time() >= self._token_expiry - TOKEN_REFRESH_MARGIN:
+                self._token, self._token_expiry = await asyncio.to_thread(self._refresh_credentials)
+                self._auth_header = f"Bearer {self._token}"
+
+    async def _refresh_token_in_background(self) -> None:
+        """백그라운드 갱신 실패는 로그만 남김 (다음 요청이 만료 직전이면 직접 갱신을 재시도)"""
+        try:
+            await self._refresh_token()
+        except Exception as e:
+            logger.warning("[VertexAI] Background token refresh failed: %s", e)
 
-        print(f"[VertexAI] Initialized with project={self.project}, location={self.location}")
-        print(f"[VertexAI] Service account: {SERVICE_ACCOUNT_FILE}")
+    async def _get_auth_header(self) -> str:
+        """Authorization 헤더 값 (토큰이 유효하면 캐시된 문자열 그대로)"""
+        await self._get_auth_token()
+        return self._auth_header
 
-    def _get_auth_token(self) -> str:
-        """인증 토큰 가져오기 (자동 갱신)"""
-        if not self.credentials.valid:
-            self.credentials.refresh(Request())
-        return self.credentials.token
+    def _refresh_credentials(self) -> tuple[str, float]:
+        """서비스 계정 토큰 갱신 (to_thread에서 호출) → (토큰, 만료 시각)"""
+        self.credentials.refresh(Request())
+        expiry = self.credentials.expiry  # google-auth: naive UTC datetime
+        if expiry is None:
+            return self.credentials.token, time.time() + 3600
+        return self.credentials.token, expiry.replace(tzinfo=timezone.utc).timestamp()
 
     @retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=2, max=60),
+        wait=_wait_retry_after_or(wait_random_exponential(multiplier=2, min=2, max=60)),
         retry=retry_if_exception_type(RetryableAPIError),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
@@ -143,8 +529,9 @@ class VertexAIService:
         """
         Text-to-Image: Imagen 3.0으로 이미지 생성
 
-        - Semaphore로 동시 실행 수 제한 (최대 10개)
-        - 429/503 에러 시 Exponential Backoff로 자동 재시도 (최대 5회)
+        - AIMD 한도로 동시 실행 수 제한 (10개에서 시작, 429/5xx 시 축소)
+        - 429/503 에러 시 지터를 넣은 Exponential Backoff로 자동 재시도 (최대 5회)
+        - 같은 프롬프트/옵션의 동시 요청은 SDK 호출 1회로 합쳐 이미지를 나눠 받음 (최대 IMAGEN_COALESCE_MAX개, seed 지정 요청 제외)
 
         Vertex AI Imagen 3.0 Python SDK 지원 파라미터 (options):
             - aspect_ratio: "1:1", "3:4", "4:3", "16:9", "9:16"
@@ -157,86 +544,128 @@ class VertexAIService:
         """
         options = options or {}
 
-        async with IMAGE_SEMAPHORE:
-            logger.info(f"[Imagen] Acquired semaphore for job {job_id}, options={options}")
+        if LOAD_TEST_MODE:
+            async with IMAGE_LIMITER.slot():
+                logger.info(f"[Imagen] Acquired concurrency slot for job {job_id}, options={options}")
+                return await self._mock_generate("image", job_id, delay_range=(2, 4))
+
+        # Imagen Python SDK 파라미터 구성 (inspect.signature 검증 완료, number_of_images는 호출 시 결정)
+        sdk_kwargs = {"prompt": prompt}
+        if options.get("aspect_ratio"):
+            sdk_kwargs["aspect_ratio"] = options["aspect_ratio"]
+        if options.get("negative_prompt"):
+            sdk_kwargs["negative_prompt"] = options["negative_prompt"]
+        if options.get("seed") is not None:
+            sdk_kwargs["seed"] = options["seed"]
+        if options.get("guidance_scale") is not None:
+            sdk_kwargs["guidance_scale"] = options["guidance_scale"]
+        if options.get("safety_filter_level"):
+            sdk_kwargs["safety_filter_level"] = options["safety_filter_level"]
+        if options.get("language"):
+            sdk_kwargs["language"] = options["language"]
+        if options.get("add_watermark") is not None:
+            sdk_kwargs["add_watermark"] = options["add_watermark"]
+
+        image_bytes = await self._generate_image_bytes(sdk_kwargs, job_id)
+
+        # 파일 저장 (동시 실행 한도 밖)
+        file_name = f"{job_id}.png"
+        file_path = os.path.join(settings.storage_path, "images", file_name)
 
-            if LOAD_TEST_MODE:
-                await asyncio.sleep(random.uniform(2, 4))
-                file_name = f"{job_id}.png"
-                file_path = os.path.join(settings.storage_path, "images", file_name)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                async with aiofiles.open(file_path, "wb") as f:
-                    await f.write(b"mock-image-data")
-                logger.info(f"[Imagen] Mock generation completed for job {job_id}")
-                return f"/storage/images/{file_name}"
-
-            # Imagen Python SDK 파라미터 구성 (inspect.signature 검증 완료)
-            sdk_kwargs = {
-                "prompt": prompt,
-                "number_of_images": 1,
-            }
-            if options.get("aspect_ratio"):
-                sdk_kwargs["aspect_ratio"] = options["aspect_ratio"]
-            if options.get("negative_prompt"):
-                sdk_kwargs["negative_prompt"] = options["negative_prompt"]
-            if options.get("seed") is not None:
-                sdk_kwargs["seed"] = options["seed"]
-            if options.get("guidance_scale") is not None:
-                sdk_kwargs["guidance_scale"] = options["guidance_scale"]
-            if options.get("safety_filter_level"):
-                sdk_kwargs["safety_filter_level"] = options["safety_filter_level"]
-            if options.get("language"):
-                sdk_kwargs["language"] = options["language"]
-            if options.get("add_watermark") is not None:
-                sdk_kwargs["add_watermark"] = options["add_watermark"]
-
-            logger.info(f"[Imagen] SDK kwargs: {sdk_kwargs}")
+        await asyncio.to_thread(_write_bytes, file_path, image_bytes)
 
-            try:
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.image_model.generate_images(**sdk_kwargs)
-                )
-            except Exception as e:
-                error_str = str(e)
-                if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                    logger.warning(f"[Imagen] Rate limit hit, will retry: {error_str}")
-                    raise RetryableAPIError(error_str)
-                if "503" in error_str or "UNAVAILABLE" in error_str:
-                    logger.warning(f"[Imagen] Service unavailable, will retry: {error_str}")
-                    raise RetryableAPIError(error_str)
-                if "500" in error_str or "INTERNAL" in error_str:
-                    logger.warning(f"[Imagen] Internal error, will retry: {error_str}")
-                    raise RetryableAPIError(error_str)
-                korean = _to_korean_safety_message(error_str)
-                if korean:
-                    logger.warning(f"[Imagen] Safety policy error: {error_str}")
-                    raise NonRetryableAPIError(korean)
-                raise NonRetryableAPIError(error_str)
+        return f"/storage/images/{file_name}"
 
-        # 안전 필터 체크: API는 200이지만 이미지가 0개일 수 있음 (RAI 필터링)
-        if not response.images:
-            logger.warning(f"[Imagen] Safety filter blocked all images for job {job_id}")
-            raise NonRetryableAPIError(
-                "생성된 이미지가 안전 정책(폭력, 선정성 등)에 의해 차단되었습니다. 프롬프트를 수정한 후 다시 시도해 주세요."
-            )
+    async def _generate_image_bytes(self, sdk_kwargs: dict, job_id: str) -> bytes:
+        """
+        이미지 1장 생성. 같은 프롬프트/옵션의 요청이 동시에 들어오면 SDK 호출 1회로 합친다.
 
-        # 파일 저장 (Semaphore 밖)
-        file_name = f"{job_id}.png"
-        file_path = os.path.join(settings.storage_path, "images", file_name)
+        먼저 온 요청(leader)이 동시 실행 슬롯을 얻기 전까지 합류한 요청(최대 IMAGEN_COALESCE_MAX - 1개)만큼
+        number_of_images를 늘려 호출하고, 결과 이미지를 1장씩 나눠준다.
+        호출이 실패하면 합류한 요청도 같은 예외로 끝나며, 각자의 @retry가 재시도를 맡는다.
+        seed를 지정한 요청은 그 seed의 단독 호출 결과를 기대하므로 합치지 않는다.
+        """
+        key = None if "seed" in sdk_kwargs else orjson.dumps(sdk_kwargs, option=orjson.OPT_SORT_KEYS)
+        batch = self._imagen_batches.get(key) if key is not None else None
+        if batch is not None and len(batch) < IMAGEN_COALESCE_MAX - 1:
+            future = asyncio.get_running_loop().create_future()
+            batch.append(future)
+            logger.info(f"[Imagen] Job {job_id} joined an in-flight request for the same prompt")
+            return await future
+
+        batch = []
+        if key is not None:
+            self._imagen_batches[key] = batch
+
+        def close_batch() -> None:
+            if self._imagen_batches.get(key) is batch:
+                del self._imagen_batches[key]
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(response.images[0]._image_bytes)
+        try:
+            # 분당 한도 대기는 슬롯 밖에서 (대기 시간이 AIMD 지연 측정에 섞이지 않고, 그동안 합류도 계속 받음)
+            await _wait_for_rate(IMAGE_RATE_LIMITER)
+            async with IMAGE_LIMITER.slot():
+                close_batch()  # 호출 직전에 합류 마감 → 이후 요청은 새 batch
+                count = 1 + len(batch)
+                logger.info(f"[Imagen] Acquired concurrency slot for job {job_id} (images={count})")
+                images = await self._call_imagen({**sdk_kwargs, "number_of_images": count})
+        except BaseException as e:
+            close_batch()
+            # leader가 취소되면 합류한 요청은 각자 재시도
+            error = e if isinstance(e, Exception) else RetryableAPIError("Coalesced Imagen request was cancelled")
+            for future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            raise
+
+        # 안전 필터: API는 200이지만 요청보다 적은(0개 포함) 이미지가 올 수 있음 (RAI 필터링)
+        for i, future in enumerate(batch, start=1):
+            if future.done():
+                continue
+            if i < len(images):
+                future.set_result(images[i]._image_bytes)
+            else:
+                future.set_exception(NonRetryableAPIError(IMAGEN_BLOCKED_MESSAGE))
+        if not images:
+            logger.warning(f"[Imagen] Safety filter blocked all images for job {job_id}")
+            raise NonRetryableAPIError(IMAGEN_BLOCKED_MESSAGE)
+        return images[0]._image_bytes
 
-        return f"/storage/images/{file_name}"
+    async def _call_imagen(self, sdk_kwargs: dict) -> list:
+        """Imagen SDK 호출(블로킹)을 전용 스레드 풀에서 실행하고, 에러를 재시도 가능/불가로 분류"""
+        logger.info(f"[Imagen] SDK kwargs: {sdk_kwargs}")
+
+        try:
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                self._imagen_executor,
+                functools.partial(self.image_model.generate_images, **sdk_kwargs),
+            )
+        except Exception as e:
+            error_str = str(e)
+            if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
+                logger.warning(f"[Imagen] Rate limit hit, will retry: {error_str}")
+                raise RetryableAPIError(error_str)
+            if "503" in error_str or "UNAVAILABLE" in error_str:
+                logger.warning(f"[Imagen] Service unavailable, will retry: {error_str}")
+                raise RetryableAPIError(error_str)
+            if "500" in error_str or "INTERNAL" in error_str:
+                logger.warning(f"[Imagen] Internal error, will retry: {error_str}")
+                raise RetryableAPIError(error_str)
+            korean = _to_korean_safety_message(error_str)
+            if korean:
+                logger.warning(f"[Imagen] Safety policy error: {error_str}")
+                raise NonRetryableAPIError(korean)
+            raise NonRetryableAPIError(error_str)
+
+        return response.images
 
     async def generate_video_from_text(self, prompt: str, job_id: str, options: dict = None) -> str:
         """
         Text-to-Video: Veo 3.0으로 텍스트에서 비디오 생성
 
-        - Semaphore로 동시 실행 수 제한 (최대 3개)
-        - LRO 요청 + 폴링 전체가 Semaphore 안에서 실행
+        - AIMD 한도로 동시 실행 수 제한 (3개에서 시작, 429/5xx 시 축소)
+        - LRO 시작 요청만 동시 실행 한도 안에서 실행 (폴링은 쿼터를 쓰지 않아 한도 밖에서 대기)
 
         Vertex AI Veo 3.0 지원 파라미터 (options):
             - aspect_ratio: "16:9", "9:16"
@@ -250,33 +679,29 @@ class VertexAIService:
         options = options or {}
         logger.info(f"[Veo] Starting text-to-video generation for job {job_id}, options={options}")
 
-        async with VIDEO_SEMAPHORE:
-            logger.info(f"[Veo] Acquired semaphore for job {job_id}")
+        async with VIDEO_LIMITER.slot():
+            logger.info(f"[Veo] Acquired concurrency slot for job {job_id}")
 
             if LOAD_TEST_MODE:
-                await asyncio.sleep(random.uniform(3, 6))
-                file_name = f"{job_id}.mp4"
-                file_path = os.path.join(settings.storage_path, "videos", file_name)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                async with aiofiles.open(file_path, "wb") as f:
-                    await f.write(b"mock-video-data")
-                logger.info(f"[Veo] Mock generation completed for job {job_id}")
-                return f"/storage/videos/{file_name}"
+                return await self._mock_generate("video", job_id, delay_range=(3, 6))
 
             operation_name = await self._start_veo_operation(
                 prompt=prompt,
                 image_base64=None,
                 options=options,
             )
-            result = await self._poll_operation(operation_name)
 
-        video_bytes = self._extract_video_from_result(result)
+        # Veo 쿼터는 분당 요청 수 기준 → 진행 중 Operation 폴링은 슬롯을 잡지 않음
+        result = await self._poll_operation(operation_name)
+
+        video_base64 = self._extract_video_from_result(result)
+        del result  # 파싱된 LRO 응답은 바로 해제 (저장하는 동안 base64 문자열만 유지)
 
         file_name = f"{job_id}.mp4"
         file_path = os.path.join(settings.storage_path, "videos", file_name)
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(video_bytes)
+        # 디코딩 + 저장을 스레드 한 번 왕복으로 (디코딩된 bytes는 이벤트 루프 쪽에 남지 않음)
+        await asyncio.to_thread(_decode_and_write, file_path, video_base64)
 
         logger.info(f"[Veo] Video saved to {file_path}")
         return f"/storage/videos/{file_name}"
@@ -285,8 +710,8 @@ class VertexAIService:
         """
         Image-to-Video: Veo 3.0으로 이미지에서 비디오 생성
 
-        - Semaphore로 동시 실행 수 제한 (최대 3개)
-        - LRO 요청 + 폴링 전체가 Semaphore 안에서 실행
+        - AIMD 한도로 동시 실행 수 제한 (3개에서 시작, 429/5xx 시 축소)
+        - LRO 시작 요청만 동시 실행 한도 안에서 실행 (폴링은 쿼터를 쓰지 않아 한도 밖에서 대기)
 
         Vertex AI Veo 3.0 Image-to-Video 지원 파라미터 (options):
             - duration_seconds: 4, 6, 8
@@ -298,20 +723,14 @@ class VertexAIService:
         options = options or {}
         logger.info(f"[Veo] Starting image-to-video generation for job {job_id}, options={options}")
 
-        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+        # MB 단위 이미지 인코딩이 이벤트 루프를 막지 않도록 스레드에서 처리 (동시 실행 한도 밖)
+        image_base64 = await asyncio.to_thread(_encode_base64, image_bytes)
 
-        async with VIDEO_SEMAPHORE:
-            logger.info(f"[Veo] Acquired semaphore for job {job_id}")
+        async with VIDEO_LIMITER.slot():
+            logger.info(f"[Veo] Acquired concurrency slot for job {job_id}")
 
             if LOAD_TEST_MODE:
-                await asyncio.sleep(random.uniform(3, 6))
-                file_name = f"{job_id}.mp4"
-                file_path = os.path.join(settings.storage_path, "videos", file_name)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                async with aiofiles.open(file_path, "wb") as f:
-                    await f.write(b"mock-video-data")
-                logger.info(f"[Veo] Mock generation completed for job {job_id}")
-                return f"/storage/videos/{file_name}"
+                return await self._mock_generate("video", job_id, delay_range=(3, 6))
 
             operation_name = await self._start_veo_operation(
                 prompt=prompt,
@@ -319,22 +738,25 @@ class VertexAIService:
                 image_mime_type=mime_type,
                 options=options,
             )
-            result = await self._poll_operation(operation_name)
 
-        video_bytes = self._extract_video_from_result(result)
+        # Veo 쿼터는 분당 요청 수 기준 → 진행 중 Operation 폴링은 슬롯을 잡지 않음
+        result = await self._poll_operation(operation_name)
+
+        video_base64 = self._extract_video_from_result(result)
+        del result  # 파싱된 LRO 응답은 바로 해제 (저장하는 동안 base64 문자열만 유지)
 
         file_name = f"{job_id}.mp4"
         file_path = os.path.join(settings.storage_path, "videos", file_name)
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(video_bytes)
+        # 디코딩 + 저장을 스레드 한 번 왕복으로 (디코딩된 bytes는 이벤트 루프 쪽에 남지 않음)
+        await asyncio.to_thread(_decode_and_write, file_path, video_base64)
 
         logger.info(f"[Veo] Video saved to {file_path}")
         return f"/storage/videos/{file_name}"
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=5, max=30),
+        wait=_wait_retry_after_or(wait_random_exponential(multiplier=2, min=5, max=30)),
         retry=retry_if_exception_type(RetryableAPIError),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
@@ -342,7 +764,7 @@ class VertexAIService:
     async def _start_veo_operation(self, prompt: str, image_base64: str = None, image_mime_type: str = None, options: dict = None) -> str:
         """
         Veo LRO 작업 시작 (REST API)
-        - 429/503 에러 시 Exponential Backoff로 자동 재시도 (최대 3회)
+        - 429/503 에러 시 Retry-After(없으면 지터 포함 Exponential Backoff)만큼 대기 후 재시도 (최대 3회)
 
         Vertex AI Veo 3.0 REST API 파라미터 (options → camelCase 변환):
             - aspect_ratio → aspectRatio: "16:9", "9:16"
@@ -357,7 +779,7 @@ class VertexAIService:
             str: Operation name (폴링에 사용)
         """
         options = options or {}
-        url = f"{self.veo_base_url}/{self.veo_endpoint}:predictLongRunning"
+        url = self.veo_predict_url
 
         # 요청 본문 구성
         instance = {"prompt": prompt}
@@ -394,42 +816,55 @@ class VertexAIService:
 
         logger.info(f"[Veo LRO] Parameters: {parameters}")
 
-        headers = {
-            "Authorization": f"Bearer {self._get_auth_token()}",
-            "Content-Type": "application/json"
-        }
-
         logger.info(f"[Veo LRO] Calling: {url}")
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        await self._wait_for_veo_quota()
+        await _wait_for_rate(VIDEO_RATE_LIMITER)
+        client = self._get_http_client()
+        response = await client.post(url, content=orjson.dumps(payload))
+        self._update_veo_quota(response)
 
-            # HTTP 상태 코드별 분류
+        # HTTP 상태 코드별 분류 (성공 응답은 본문을 문자열로 만들지 않음)
+        if not response.is_success:
+            body = _error_body(response)
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
             if response.status_code == 429:
-                raise RetryableAPIError(f"Rate limit exceeded: {response.text}")
+                raise RetryableAPIError(f"Rate limit exceeded: {body}", retry_after=retry_after)
             if response.status_code >= 500:
-                raise RetryableAPIError(f"Server error {response.status_code}: {response.text}")
-            if response.status_code != 200:
-                korean = _to_korean_safety_message(response.text)
-                if korean:
-                    logger.warning(f"[Veo LRO] Safety policy error in request: {response.text}")
-                    raise NonRetryableAPIError(korean)
-                raise NonRetryableAPIError(f"Client error {response.status_code}: {response.text}")
-
-            result = response.json()
-            operation_name = result.get("name")
-
-            if not operation_name:
-                raise NonRetryableAPIError(f"No operation name in response: {result}")
-
-            logger.info(f"[Veo LRO] Operation started: {operation_name}")
-            return operation_name
+                raise RetryableAPIError(f"Server error {response.status_code}: {body}", retry_after=retry_after)
+            korean = _to_korean_safety_message(body)
+            if korean:
+                logger.warning(f"[Veo LRO] Safety policy error in request: {body}")
+                raise NonRetryableAPIError(korean)
+            raise NonRetryableAPIError(f"Client error {response.status_code}: {body}")
+
+        result = orjson.loads(response.content)
+        operation_name = result.get("name")
+
+        if not operation_name:
+            raise NonRetryableAPIError(f"No operation name in response: {result}")
+
+        logger.info(f"[Veo LRO] Operation started: {operation_name}")
+        return operation_name
+
+    async def _wait_for_veo_quota(self) -> None:
+        """직전 응답에서 쿼터 소진 임박을 감지했다면 해제 시각까지 대기 (429를 받기 전에 속도 조절)"""
+        delay = self._veo_paused_until - time.monotonic()
+        if delay > 0:
+            logger.info(f"[Veo LRO] Quota nearly exhausted, pausing {delay:.1f}s before request")
+            await asyncio.sleep(delay)
+
+    def _update_veo_quota(self, response: httpx.Response) -> None:
+        pause = _quota_pause_seconds(response)
+        if pause is not None:
+            self._veo_paused_until = max(self._veo_paused_until, time.monotonic() + pause)
 
     async def _poll_operation(self, operation_name: str) -> dict:
         """
-        Operation 완료까지 폴링 (REST API)
+        Operation 완료까지 대기
 
-        Veo LRO는 fetchPredictOperation 엔드포인트를 사용합니다.
+        직접 폴링 루프를 돌지 않고 Future를 등록한 뒤 백그라운드 poller가
+        결과를 채워줄 때까지 기다린다 (진행 중인 모든 LRO를 poller 1개가 처리).
 
         Args:
             operation_name: predictLongRunning에서 반환된 operation name
@@ -437,76 +872,137 @@ class VertexAIService:
         Returns:
             dict: 완료된 Operation의 결과
         """
-        # fetchPredictOperation 엔드포인트 사용
-        url = f"{self.veo_base_url}/{self.veo_endpoint}:fetchPredictOperation"
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # 첫 조회는 대기 없이 바로 (짧게 끝나는 Operation은 첫 응답에서 done) → 미완료일 때만 간격 증가
+        pending = _PendingOperation(
+            future=loop.create_future(),
+            started_at=now,
+            next_poll_at=now,
+        )
+        self._pending[operation_name] = pending
+        logger.debug("[Veo LRO] Waiting for operation: %s", operation_name)
 
-        print(f"[Veo LRO] Polling URL: {url}")
-        print(f"[Veo LRO] Operation name: {operation_name}")
-        start_time = time.time()
+        if self._poller_task is None or self._poller_task.done():
+            self._poller_wakeup = asyncio.Event()
+            self._poller_task = asyncio.create_task(self._poller_loop())
+        else:
+            # 실행 중인 poller는 다른 Operation의 긴 간격(최대 10초)만큼 대기 중일 수 있음 → 깨워서 첫 조회를 바로
+            self._poller_wakeup.set()
 
-        headers = {
-            "Authorization": f"Bearer {self._get_auth_token()}",
-            "Content-Type": "application/json"
-        }
+        try:
+            # 등록 시각 기준 마감 (Future를 감싸는 별도 task 없이 기다림, 마감 시 Future는 취소되어 poller가 건너뜀)
+            async with asyncio.timeout_at(pending.started_at + LRO_MAX_WAIT_TIME):
+                return await pending.future
+        except TimeoutError:
+            raise TimeoutError(f"Veo operation timed out after {LRO_MAX_WAIT_TIME} seconds")
+        finally:
+            self._pending.pop(operation_name, None)
+
+    async def _poller_loop(self) -> None:
+        """진행 중인 LRO가 남아 있는 동안 각 Operation을 자기 간격에 맞춰 폴링"""
+        loop = asyncio.get_running_loop()
+        wakeup = self._poller_wakeup
+        while self._pending:
+            next_at = min(p.next_poll_at for p in self._pending.values())
+            # 가장 이른 폴링 시각까지 대기하되, 새 Operation이 등록되면 즉시 깨어나 일정을 다시 계산
+            try:
+                async with asyncio.timeout_at(next_at):
+                    await wakeup.wait()
+            except TimeoutError:
+                pass
+            wakeup.clear()
+
+            # 이번 tick에 폴링할 Operation들을 동시에 조회 (인증 헤더는 클라이언트의 _BearerAuth가 부착)
+            now = loop.time()
+            due = [(name, p) for name, p in self._pending.items() if p.next_poll_at <= now]
+            if not due:
+                continue
+            url = self.veo_fetch_url
+            outcomes = await asyncio.gather(
+                *(self._fetch_operation(url, name, now - p.started_at) for name, p in due),
+                return_exceptions=True,
+            )
+
+            for (operation_name, pending), outcome in zip(due, outcomes):
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    self._pending.pop(operation_name, None)
+                    if not pending.future.done():
+                        pending.future.set_exception(outcome)
+                    continue
+
+                result, retry_after = outcome
+                if result is not None:
+                    self._pending.pop(operation_name, None)
+                    if not pending.future.done():
+                        pending.future.set_result(result)
+                    continue
+
+                # 다음 폴링 시각: 서버가 Retry-After를 주면 그대로, 아니면 지수 증가 간격
+                if retry_after is not None:
+                    pending.next_poll_at = loop.time() + retry_after
+                else:
+                    pending.next_poll_at = loop.time() + pending.delay
+                    pending.delay = min(LRO_POLL_MAX_INTERVAL, pending.delay * LRO_POLL_BACKOFF)
+
+    async def _fetch_operation(self, url: str, operation_name: str, elapsed: float) -> tuple[dict | None, float | None]:
+        """
+        fetchPredictOperation 1회 호출 (REST API)
 
-        # fetchPredictOperation 요청 본문
+        Returns:
+            (완료 시 결과 dict / 진행 중이면 None, 서버 Retry-After 초)
+        """
         payload = {
             "operationName": operation_name
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            while True:
-                elapsed = time.time() - start_time
-
-                # 타임아웃 체크
-                if elapsed > LRO_MAX_WAIT_TIME:
-                    raise TimeoutError(f"Veo operation timed out after {LRO_MAX_WAIT_TIME} seconds")
+        client = self._get_http_client()
+        response = await client.post(url, content=orjson.dumps(payload), timeout=HTTP_POLL_TIMEOUT)
 
-                # Operation 상태 조회 (POST 요청)
-                response = await client.post(url, json=payload, headers=headers)
+        if not response.is_success:
+            raise Exception(f"Failed to poll operation: {response.status_code} - {_error_body(response)}")
 
-                if response.status_code != 200:
-                    raise Exception(f"Failed to poll operation: {response.status_code} - {response.text}")
+        result = orjson.loads(response.content)
 
-                result = response.json()
+        # 완료 여부 확인
+        if result.get("done"):
+            logger.info(f"[Veo LRO] Operation completed after {elapsed:.1f}s")
 
-                # 완료 여부 확인
-                if result.get("done"):
-                    print(f"[Veo LRO] Operation completed after {elapsed:.1f}s")
-
-                    # 에러 체크
-                    if "error" in result:
-                        error = result["error"]
-                        raw_msg = error.get("message", str(error))
-                        korean = _to_korean_safety_message(raw_msg)
-                        if korean:
-                            logger.warning(f"[Veo LRO] Safety policy error: {raw_msg}")
-                            raise Exception(korean)
-                        raise Exception(f"Veo operation failed: {raw_msg}")
+            # 에러 체크
+            if "error" in result:
+                error = result["error"]
+                raw_msg = error.get("message", str(error))
+                korean = _to_korean_safety_message(raw_msg)
+                if korean:
+                    logger.warning(f"[Veo LRO] Safety policy error: {raw_msg}")
+                    raise Exception(korean)
+                raise Exception(f"Veo operation failed: {raw_msg}")
 
-                    # 응답 구조 로깅 (디버깅용)
-                    print(f"[Veo LRO] Full response keys: {list(result.keys())}")
-                    print(f"[Veo LRO] Full response: {result}")
+            # 응답 구조는 키만 로깅 (응답 전체에는 수십 MB의 base64 비디오가 들어 있음)
+            logger.debug("[Veo LRO] Response keys: %s", list(result))
 
-                    return result.get("response", result)
+            return result.get("response", result), None
 
-                # 진행 상황 로깅
-                metadata = result.get("metadata", {})
-                state = metadata.get("state", "RUNNING")
-                print(f"[Veo LRO] State: {state}, waiting... ({elapsed:.0f}s elapsed)")
+        # 진행 상황 로깅
+        metadata = result.get("metadata", {})
+        state = metadata.get("state", "RUNNING")
+        logger.debug("[Veo LRO] State: %s, waiting... (%.0fs elapsed)", state, elapsed)
 
-                # 폴링 간격만큼 대기
-                await asyncio.sleep(LRO_POLL_INTERVAL)
+        return None, _parse_retry_after(response.headers.get("Retry-After"))
 
-    def _extract_video_from_result(self, result: dict) -> bytes:
+    def _extract_video_from_result(self, result: dict) -> str:
         """
-        LRO 결과에서 비디오 바이트 추출
+        LRO 결과에서 비디오 base64 문자열 추출 (디코딩은 저장과 함께 스레드에서 수행)
+
+        응답 dict에서 pop하여 결과 dict가 큰 문자열을 계속 붙잡고 있지 않도록 한다.
 
         Args:
             result: Operation response
 
         Returns:
-            bytes: 비디오 파일 바이트
+            str: 비디오 파일의 base64 문자열
         """
         # RAI 안전 필터 체크 (try 밖 — 한글 메시지가 이중 래핑되지 않도록)
         rai_count = result.get("raiMediaFilteredCount", 0)
@@ -518,53 +1014,37 @@ class VertexAIService:
             raise Exception(korean or "생성된 콘텐츠가 안전 정책에 의해 차단되었습니다. 프롬프트를 수정한 후 다시 시도해 주세요.")
 
         try:
-            # 방법 1: predictions 배열에서 추출
-            predictions = result.get("predictions", [])
-            if predictions:
-                prediction = predictions[0]
-
-                # 직접 bytesBase64Encoded
-                if "bytesBase64Encoded" in prediction:
-                    print("[Veo LRO] Found video in predictions.bytesBase64Encoded")
-                    return base64.b64decode(prediction["bytesBase64Encoded"])
-
-                # video.bytesBase64Encoded
-                if "video" in prediction:
-                    video_data = prediction["video"]
-                    if "bytesBase64Encoded" in video_data:
-                        print("[Veo LRO] Found video in predictions.video.bytesBase64Encoded")
-                        return base64.b64decode(video_data["bytesBase64Encoded"])
-
-            # 방법 2: videos 배열에서 추출 (GenerateVideoResponse 형식)
-            videos = result.get("videos", [])
-            if videos:
-                video = videos[0]
-                if "bytesBase64Encoded" in video:
-                    print("[Veo LRO] Found video in videos[0].bytesBase64Encoded")
-                    return base64.b64decode(video["bytesBase64Encoded"])
-
-            # 방법 3: generatedSamples에서 추출
-            generated_samples = result.get("generatedSamples", [])
-            if generated_samples:
-                sample = generated_samples[0]
-                if "video" in sample and "bytesBase64Encoded" in sample["video"]:
-                    print("[Veo LRO] Found video in generatedSamples.video.bytesBase64Encoded")
-                    return base64.b64decode(sample["video"]["bytesBase64Encoded"])
-
-            # 방법 4: 직접 video 필드
-            if "video" in result and "bytesBase64Encoded" in result["video"]:
-                print("[Veo LRO] Found video in result.video.bytesBase64Encoded")
-                return base64.b64decode(result["video"]["bytesBase64Encoded"])
-
-            # 디버깅용 로깅
-            print(f"[Veo LRO] Result structure: {list(result.keys())}")
-            print(f"[Veo LRO] Full result: {result}")
+            paths = _VIDEO_PATHS if self._video_path is None else (self._video_path, *_VIDEO_PATHS)
+            for path in paths:
+                container = _walk(result, path)
+                if isinstance(container, dict) and "bytesBase64Encoded" in container:
+                    if path != self._video_path:
+                        logger.debug("[Veo LRO] Found video in %s.bytesBase64Encoded", _format_path(path))
+                        self._video_path = path
+                    return container.pop("bytesBase64Encoded")
+
+            # 디버깅용 로깅 (키만 — 결과 전체를 문자열화하지 않음)
+            logger.warning(f"[Veo LRO] Result structure: {list(result)}")
 
             raise Exception("Could not find video data in result")
 
         except Exception as e:
-            print(f"[Veo LRO] Error extracting video: {e}")
+            logger.error(f"[Veo LRO] Error extracting video: {e}")
             raise Exception(f"Failed to extract video from response: {e}")
 
 
-vertex_ai_service = VertexAIService()
+# 싱글톤: import만으로 vertexai.init / from_pretrained(네트워크 호출)가 실행되지 않도록 모듈 로드 시 만들지 않고,
+# 앱 lifespan에서 트래픽을 받기 전에 스레드로 한 번 생성한다 (이벤트 루프 블로킹 방지, 잘못된 인증 정보는 기동 실패).
+_vertex_ai_service: VertexAIService | None = None
+
+def get_vertex_ai_service() -> VertexAIService:
+    """싱글톤 반환. 최초 생성은 블로킹(인증 파일 읽기/SDK 초기화)이므로 lifespan에서 to_thread로 호출"""
+    global _vertex_ai_service
+    if _vertex_ai_service is None:
+        _vertex_ai_service = VertexAIService()
+    return _vertex_ai_service
+
+async def close_vertex_ai_service() -> None:
+    """앱 종료 시 호출. 생성된 적 없으면 아무것도 하지 않음 (종료 시점에 초기화하지 않도록)"""
+    if _vertex_ai_service is not None:
+        await _vertex_ai_service.aclose()
@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "assets_prompt_model_asset_type_created_at_idx" ON "assets"("prompt", "model", "asset_type", "created_at" DESC);
@@ -0,0 +1,13 @@
+-- AlterTable
+ALTER TABLE "assets" ADD COLUMN "prompt_hash" CHAR(64);
+
+-- Backfill: assets.prompt는 이미 정규화(strip + lower)된 값으로 저장되어 있음
+UPDATE "assets" SET "prompt_hash" = encode(sha256(convert_to("prompt", 'UTF8')), 'hex');
+
+ALTER TABLE "assets" ALTER COLUMN "prompt_hash" SET NOT NULL;
+
+-- DropIndex
+DROP INDEX "assets_prompt_model_asset_type_created_at_idx";
+
+-- CreateIndex
+CREATE INDEX "assets_prompt_hash_model_asset_type_created_at_idx" ON "assets"("prompt_hash", "model", "asset_type", "created_at" DESC);
@@ -0,0 +1,101 @@
+"""
+AssetCache 단위 테스트
+
+테스트 대상: backend/app/services/asset_cache.py
+- prompt + model + assetType 키 조회/저장 검증
+- LRU 크기 제한, TTL 만료, 에셋 삭제 시 무효화 검증
+- 외부 의존성 없음 (인메모리)
+
+유형: Unit Test — 혼자 동작 가능 (OrderedDict만 사용)
+"""
+import time
+
+import pytest
+from app.services.asset_cache import AssetCache, normalize_prompt, prompt_hash
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def cache() -> AssetCache:
+    return AssetCache(maxsize=2)
+
+
+def test_get_miss_returns_none(cache: AssetCache):
+    """저장되지 않은 키 조회 시 None 반환"""
+    assert cache.get("a cat", "imagen-3.0", "image") is None
+
+
+def test_put_then_get_returns_entry(cache: AssetCache):
+    """저장한 에셋이 asset_id, result_url 형태로 반환되는지 검증"""
+    cache.put("a cat", "imagen-3.0", "image", 1, "/storage/images/1.png")
+
+    assert cache.get("a cat", "imagen-3.0", "image") == {
+        "asset_id": 1,
+        "result_url": "/storage/images/1.png",
+    }
+
+
+def test_key_includes_model_and_asset_type(cache: AssetCache):
+    """같은 프롬프트라도 model/assetType이 다르면 별도 항목"""
+    cache.put("a cat", "imagen-3.0", "image", 1, "/storage/images/1.png")
+
+    assert cache.get("a cat", "veo-3.0", "image") is None
+    assert cache.get("a cat", "imagen-3.0", "video") is None
+
+
+def test_put_overwrites_with_newest_asset(cache: AssetCache):
+    """같은 키에 새 에셋이 생성되면 최신 에셋으로 교체"""
+    cache.put("a cat", "imagen-3.0", "image", 1, "/storage/images/1.png")
+    cache.put("a cat", "imagen-3.0", "image", 2, "/storage/images/2.png")
+
+    assert cache.get("a cat", "imagen-3.0", "image")["asset_id"] == 2
+    assert len(cache) == 1
+
+
+def test_evicts_least_recently_used(cache: AssetCache):
+    """maxsize 초과 시 가장 오래 사용되지 않은 항목부터 제거"""
+    cache.put("first", "imagen-3.0", "image", 1, "/storage/images/1.png")
+    cache.put("second", "imagen-3.0", "image", 2, "/storage/images/2.png")
+    cache.get("first", "imagen-3.0", "image")  # first를 최근 사용으로 갱신
+    cache.put("third", "imagen-3.0", "image", 3, "/storage/images/3.png")
+
+    assert cache.get("second", "imagen-3.0", "image") is None
+    assert cache.get("first", "imagen-3.0", "image") is not None
+    assert len(cache) == 2
+
+
+def test_expired_entry_is_not_returned():
+    """TTL이 지난 항목은 조회되지 않고 제거됨"""
+    cache = AssetCache(maxsize=2, ttl_seconds=0.05)
+    cache.put("a cat", "imagen-3.0", "image", 1, "/storage/images/1.png")
+
+    time.sleep(0.06)
+
+    assert cache.get("a cat", "imagen-3.0", "image") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_asset_removes_entry(cache: AssetCache):
+    """에셋 삭제 시 해당 에셋을 가리키는 항목이 제거되는지 검증"""
+    cache.put("a cat", "imagen-3.0", "image", 1, "/storage/images/1.png")
+    cache.invalidate_asset(1)
+
+    assert cache.get("a cat", "imagen-3.0", "image") is None
+
+
+def test_invalidate_unknown_asset_does_nothing(cache: AssetCache):
+    """캐시에 없는 에셋 무효화 시 에러 없이 무시"""
+    cache.put("a cat", "imagen-3.0", "image", 1, "/storage/images/1.png")
+    cache.invalidate_asset(999)
+
+    assert len(cache) == 1
+
+
+def test_prompt_hash_is_fixed_length_and_stable():
+    """promptHash는 정규화된 프롬프트 기준 64자 hex — 공백/대소문자 차이는 같은 해시"""
+    h = prompt_hash(normalize_prompt("  A Cat  "))
+
+    assert len(h) == 64
+    assert h == prompt_hash(normalize_prompt("a cat"))
+    assert h != prompt_hash(normalize_prompt("a dog"))
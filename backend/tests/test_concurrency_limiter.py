@@ -0,0 +1,95 @@
+"""
+AIMDLimiter 단위 테스트
+
+테스트 대상: backend/app/services/concurrency_limiter.py
+- 현재 한도만큼만 동시 실행되는지 검증
+- 성공 시 한도 증가, 과부하 예외/지연 초과 시 한도 감소 (최소/최대 범위 유지) 검증
+- 외부 의존성 없음 (asyncio만 사용)
+
+유형: Unit Test — 혼자 동작 가능
+"""
+import asyncio
+
+import pytest
+from app.services.concurrency_limiter import AIMDLimiter
+
+pytestmark = pytest.mark.unit
+
+
+class OverloadError(Exception):
+    pass
+
+
+def make_limiter(**kwargs) -> AIMDLimiter:
+    params = dict(initial=2, min_limit=1, max_limit=4, overload_errors=(OverloadError,))
+    params.update(kwargs)
+    return AIMDLimiter(**params)
+
+
+async def test_limits_concurrent_slots_to_current_limit():
+    """동시 실행 수가 현재 한도(2)를 넘지 않는지 검증"""
+    limiter = make_limiter(max_limit=2)
+    tracker = {"current": 0, "max": 0}
+
+    async def task():
+        async with limiter.slot():
+            tracker["current"] += 1
+            tracker["max"] = max(tracker["max"], tracker["current"])
+            await asyncio.sleep(0.01)
+            tracker["current"] -= 1
+
+    await asyncio.gather(*(task() for _ in range(6)))
+
+    assert tracker["max"] == 2
+    assert limiter.in_use == 0
+
+
+async def test_success_increases_limit_up_to_max():
+    """성공할 때마다 한도 +1, max_limit에서 멈춤"""
+    limiter = make_limiter()
+
+    for _ in range(5):
+        async with limiter.slot():
+            pass
+
+    assert limiter.limit == 4
+
+
+async def test_overload_error_halves_limit_down_to_min():
+    """과부하 예외 발생 시 한도가 절반으로 줄고 min_limit 아래로는 내려가지 않음"""
+    limiter = make_limiter(initial=4)
+
+    for _ in range(3):
+        with pytest.raises(OverloadError):
+            async with limiter.slot():
+                raise OverloadError()
+
+    assert limiter.limit == 1
+    assert limiter.in_use == 0
+
+
+async def test_other_error_keeps_limit():
+    """과부하와 무관한 예외(잘못된 요청 등)는 한도를 바꾸지 않음"""
+    limiter = make_limiter()
+
+    with pytest.raises(ValueError):
+        async with limiter.slot():
+            raise ValueError()
+
+    assert limiter.limit == 2
+
+
+def test_slow_success_decreases_limit():
+    """성공이라도 목표 지연을 넘으면 과부하로 보고 한도 감소"""
+    limiter = make_limiter(initial=4, latency_target=1.0)
+
+    limiter.on_result(True, latency=2.0)
+
+    assert limiter.limit == 2
+
+
+def test_stats_reflect_current_limit():
+    """stats()가 현재 한도/사용 중/여유 permit을 반환"""
+    limiter = make_limiter()
+
+    assert limiter.stats() == {"max": 2, "available": 2, "in_use": 0}
@@ -0,0 +1,171 @@
+"""
+Imagen 동시 요청 합치기(coalescing) 단위 테스트
+
+테스트 대상: backend/app/services/vertex_ai.py (VertexAIService._generate_image_bytes)
+- 같은 프롬프트/옵션의 동시 요청 → SDK 호출 1회, 결과 이미지를 1장씩 분배
+- 안전 필터로 이미지가 부족하면 못 받은 요청만 차단 에러
+- leader 취소 시 합류한 요청은 재시도 가능 에러로 종료
+- seed 지정 요청은 합치지 않음
+- SDK 호출(_call_imagen)과 분당 한도 대기(_wait_for_rate)는 stub으로 대체
+
+유형: Unit Test — LOAD_TEST_MODE로 임포트 (GCP SDK/인증 없이 합치기 로직만 사용)
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def gate(vertex_ai, monkeypatch):
+    """leader가 분당 한도 대기에서 멈춰 있도록 하는 게이트 (set 전까지 합류 요청을 받음)"""
+    event = asyncio.Event()
+
+    async def fake_wait_for_rate(limiter):
+        await event.wait()
+
+    monkeypatch.setattr(vertex_ai, "_wait_for_rate", fake_wait_for_rate)
+    return event
+
+
+@pytest.fixture
+def service(vertex_ai):
+    return vertex_ai.VertexAIService()
+
+
+def stub_imagen(service, image_count=None):
+    """
+    _call_imagen stub: 요청한 number_of_images만큼 (image_count 지정 시 그 수만큼) 이미지 반환
+
+    이미지 바이트는 b"img-0", b"img-1", ... 호출 kwargs는 calls에 기록
+    """
+    calls = []
+
+    async def fake_call_imagen(sdk_kwargs):
+        calls.append(sdk_kwargs)
+        count = sdk_kwargs["number_of_images"] if image_count is None else image_count
+        return [SimpleNamespace(_image_bytes=f"img-{i}".encode()) for i in range(count)]
+
+    service._call_imagen = fake_call_imagen
+    return calls
+
+
+async def start_requests(service, sdk_kwargs, n):
+    """같은 kwargs로 요청 n개를 시작하고 모두 leader에 합류(또는 대기)할 때까지 진행"""
+    tasks = [asyncio.create_task(service._generate_image_bytes(dict(sdk_kwargs), f"job-{i}")) for i in range(n)]
+    await asyncio.sleep(0)
+    return tasks
+
+
+# ===== 합치기 / 분배 =====
+
+async def test_followers_share_one_call(service, gate):
+    """leader + 합류 2개 → SDK 호출 1회(number_of_images=3), 이미지를 요청 순서대로 1장씩"""
+    calls = stub_imagen(service)
+
+    tasks = await start_requests(service, {"prompt": "a sword"}, 3)
+    gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == [b"img-0", b"img-1", b"img-2"]
+    assert calls == [{"prompt": "a sword", "number_of_images": 3}]
+    assert service._imagen_batches == {}
+
+
+async def test_batch_capped_at_coalesce_max(service, gate, vertex_ai):
+    """IMAGEN_COALESCE_MAX를 넘는 요청은 새 batch의 leader가 됨"""
+    calls = stub_imagen(service)
+    n = vertex_ai.IMAGEN_COALESCE_MAX + 1
+
+    tasks = await start_requests(service, {"prompt": "a sword"}, n)
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert sorted(c["number_of_images"] for c in calls) == [1, vertex_ai.IMAGEN_COALESCE_MAX]
+
+
+async def test_different_options_not_coalesced(service, gate):
+    """옵션이 다르면 각자 호출"""
+    calls = stub_imagen(service)
+
+    tasks = [
+        asyncio.create_task(service._generate_image_bytes({"prompt": "a sword"}, "job-0")),
+        asyncio.create_task(service._generate_image_bytes({"prompt": "a sword", "aspect_ratio": "16:9"}, "job-1")),
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert [c["number_of_images"] for c in calls] == [1, 1]
+
+
+async def test_seed_requests_not_coalesced(service, gate):
+    """seed 지정 요청은 같은 kwargs여도 각자 number_of_images=1로 호출 (seed의 단독 결과 보장)"""
+    calls = stub_imagen(service)
+
+    tasks = await start_requests(service, {"prompt": "a sword", "seed": 42}, 2)
+    gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == [b"img-0", b"img-0"]
+    assert calls == [{"prompt": "a sword", "seed": 42, "number_of_images": 1}] * 2
+    assert service._imagen_batches == {}
+
+
+# ===== 안전 필터 / 실패 =====
+
+async def test_partial_safety_filter_blocks_only_missing(service, gate, vertex_ai):
+    """3장 요청에 2장만 반환 → 앞의 2개는 이미지, 마지막 합류 요청만 차단 에러"""
+    stub_imagen(service, image_count=2)
+
+    tasks = await start_requests(service, {"prompt": "a sword"}, 3)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert results[:2] == [b"img-0", b"img-1"]
+    assert isinstance(results[2], vertex_ai.NonRetryableAPIError)
+    assert str(results[2]) == vertex_ai.IMAGEN_BLOCKED_MESSAGE
+
+
+async def test_all_blocked_fails_every_request(service, gate, vertex_ai):
+    """이미지 0장 → leader와 합류 요청 모두 차단 에러"""
+    stub_imagen(service, image_count=0)
+
+    tasks = await start_requests(service, {"prompt": "a sword"}, 2)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, vertex_ai.NonRetryableAPIError) for r in results)
+
+
+async def test_call_error_propagates_to_followers(service, gate, vertex_ai):
+    """SDK 호출 실패 → 합류 요청도 같은 예외 (각자의 @retry가 재시도 판단)"""
+    error = vertex_ai.RetryableAPIError("429 RESOURCE_EXHAUSTED")
+
+    async def failing_call_imagen(sdk_kwargs):
+        raise error
+
+    service._call_imagen = failing_call_imagen
+
+    tasks = await start_requests(service, {"prompt": "a sword"}, 2)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert results == [error, error]
+    assert service._imagen_batches == {}
+
+
+async def test_leader_cancel_fails_followers_retryable(service, gate, vertex_ai):
+    """leader가 호출 전에 취소 → 합류 요청은 RetryableAPIError, batch 정리"""
+    calls = stub_imagen(service)
+
+    leader, follower = await start_requests(service, {"prompt": "a sword"}, 2)
+    leader.cancel()
+    results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert isinstance(results[1], vertex_ai.RetryableAPIError)
+    assert calls == []
+    assert service._imagen_batches == {}
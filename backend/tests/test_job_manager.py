@@ -7,8 +7,11 @@ JobManager 단위 테스트
 
 유형: Unit Test — 혼자 동작 가능 (dict만 사용)
 """
+import time
+import uuid
+
 import pytest
-from app.services.job_manager import JobManager, JobInfo
+from app.services.job_manager import JobManager, JobInfo, new_job_id
 
 pytestmark = pytest.mark.unit
 
@@ -40,6 +43,20 @@ async def test_create_job_has_created_at(job_manager: JobManager):
     assert job.created_at is not None
 
 
+async def test_create_job_with_initial_state(job_manager: JobManager):
+    """캐시 히트처럼 완료 상태로 바로 생성하는 경우 초기값이 반영되는지 검증"""
+    job = await job_manager.create_job(
+        "test-id-004",
+        status="completed",
+        asset_id=7,
+        result_url="/storage/images/cached.png",
+    )
+
+    assert job.status == "completed"
+    assert job.asset_id == 7
+    assert job.result_url == "/storage/images/cached.png"
+
+
 # ===== Job 조회 테스트 =====
 
 async def test_get_existing_job(job_manager: JobManager):
@@ -170,3 +187,64 @@ async def test_multiple_jobs_are_independent(job_manager: JobManager):
     assert job1.status == "completed"
     assert job2.status == "failed"
     assert job3.status == "pending"  # 초기 상태 유지
+
+
+# ===== 보관 상한 테스트 =====
+
+async def test_evicts_oldest_terminal_job_first():
+    """상한 초과 시 진행 중인 Job보다 오래된 완료 Job을 먼저 제거"""
+    jm = JobManager(max_jobs=2)
+    await jm.create_job("active", persisted=True)
+    await jm.create_job("done", status="completed", persisted=True)
+    await jm.create_job("new", persisted=True)
+
+    assert await jm.get_job("done") is None
+    assert await jm.get_job("active") is not None
+    assert await jm.get_job("new") is not None
+
+
+async def test_evicts_oldest_job_when_none_terminal():
+    """완료 Job이 없으면 가장 오래된 Job 제거, 구독 중인 Job은 유지"""
+    jm = JobManager(max_jobs=2)
+    watched = await jm.create_job("watched", persisted=True)
+    jm.subscribe(watched)
+    await jm.create_job("oldest-idle", persisted=True)
+    await jm.create_job("new", persisted=True)
+
+    assert await jm.get_job("oldest-idle") is None
+    assert await jm.get_job("watched") is watched
+
+
+async def test_does_not_evict_jobs_without_db_row():
+    """DB에 행이 없는 Job은 DB 폴백으로 복원할 수 없으므로 상한을 넘어도 제거하지 않음"""
+    jm = JobManager(max_jobs=2)
+    await jm.create_job("memory-only-done", status="completed")
+    await jm.create_job("memory-only-active")
+    await jm.create_job("persisted-active", persisted=True)
+    await jm.create_job("new", persisted=True)
+
+    assert await jm.get_job("memory-only-done") is not None
+    assert await jm.get_job("memory-only-active") is not None
+    assert await jm.get_job("persisted-active") is None
+
+
+# ===== Job ID 생성 테스트 =====
+
+def test_new_job_id_is_uuid_v7():
+    """생성된 job_id가 32자 hex UUID(버전 7, RFC 4122 variant)인지 검증"""
+    job_id = new_job_id()
+    parsed = uuid.UUID(hex=job_id)
+
+    assert len(job_id) == 32
+    assert parsed.hex == job_id
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_new_job_id_sorts_by_creation_time():
+    """나중에 생성된 job_id가 문자열 정렬상 뒤에 오는지 검증 (ms 단위)"""
+    first = new_job_id()
+    time.sleep(0.002)
+    second = new_job_id()
+
+    assert first < second
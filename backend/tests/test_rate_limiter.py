@@ -0,0 +1,73 @@
+"""
+RateLimiter 단위 테스트
+
+테스트 대상: backend/app/services/rate_limiter.py
+- 사용자별 슬라이딩 윈도우 요청 제한 검증
+- 외부 의존성 없음 (인메모리)
+
+유형: Unit Test — 혼자 동작 가능 (deque만 사용)
+"""
+import time
+
+import pytest
+from app.services.rate_limiter import RateLimiter
+
+pytestmark = pytest.mark.unit
+
+
+def test_allows_requests_up_to_limit():
+    """limit 이하의 요청은 모두 허용 (None 반환)"""
+    limiter = RateLimiter(limit=3, window_seconds=60)
+
+    assert [limiter.hit(1) for _ in range(3)] == [None, None, None]
+
+
+def test_rejects_request_over_limit_with_retry_after():
+    """limit 초과 요청은 거부되고 남은 대기 시간(초)을 반환"""
+    limiter = RateLimiter(limit=2, window_seconds=60)
+    limiter.hit(1)
+    limiter.hit(1)
+
+    retry_after = limiter.hit(1)
+
+    assert retry_after is not None
+    assert 0 < retry_after <= 60
+
+
+def test_limits_are_per_key():
+    """한 사용자의 한도 초과가 다른 사용자에게 영향을 주지 않음"""
+    limiter = RateLimiter(limit=1, window_seconds=60)
+    limiter.hit(1)
+
+    assert limiter.hit(1) is not None
+    assert limiter.hit(2) is None
+
+
+def test_window_expiry_allows_again():
+    """윈도우가 지나면 다시 요청 가능"""
+    limiter = RateLimiter(limit=1, window_seconds=0.05)
+    limiter.hit(1)
+    assert limiter.hit(1) is not None
+
+    time.sleep(0.06)
+
+    assert limiter.hit(1) is None
+
+
+def test_idle_keys_are_dropped_after_window():
+    """윈도우 안에 요청이 없는 키는 정리되어 _hits에 남지 않음"""
+    limiter = RateLimiter(limit=5, window_seconds=0.05)
+    limiter.hit(1)
+    limiter.hit(2)
+
+    time.sleep(0.06)
+    limiter.hit(3)
+
+    assert list(limiter._hits) == [3]
+
+
+def test_non_positive_limit_disables_limiting():
+    """limit이 0 이하면 제한 없이 모두 허용"""
+    limiter = RateLimiter(limit=0)
+
+    assert all(limiter.hit(1) is None for _ in range(100))
@@ -2,9 +2,10 @@
 Exponential Backoff 재시도 시뮬레이션 테스트
 
 vertex_ai.py에 적용된 것과 동일한 tenacity 설정으로
-재시도 동작을 검증합니다. (Vertex AI 모듈을 직접 import하지 않음)
+재시도 동작을 검증합니다. (에러 분류 로직은 재현, Retry-After 대기는 vertex_ai.py의 실제 함수 사용)
 
-유형: Simulation Test — import 불가 모듈(vertex_ai.py)의 로직을 동일 설정으로 재현
+유형: Simulation Test — 에러 분류/재시도 설정을 동일 설정으로 재현
+      Retry-After 대기(_wait_retry_after_or / _parse_retry_after)는 vertex_ai fixture로 임포트해 직접 검증
 """
 import pytest
 import logging
@@ -13,7 +14,7 @@ pytestmark = pytest.mark.simulation
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
     before_sleep_log,
 )
@@ -24,17 +25,24 @@ logger = logging.getLogger(__name__)
 # vertex_ai.py에 정의된 것과 동일한 예외 클래스
 class RetryableAPIError(Exception):
     """429, 503 등 재시도 가능한 에러"""
-    pass
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 class NonRetryableAPIError(Exception):
     """400 등 재시도 불가한 에러"""
     pass
 
 
+# 테스트용 백오프: 대기 시간 최소화 (Retry-After 테스트는 vertex_ai의 _wait_retry_after_or로 감싸서 사용)
+TEST_BACKOFF = wait_random_exponential(multiplier=0.01, min=0.01, max=0.1)
+
+
 # vertex_ai.py의 generate_image와 동일한 @retry 설정을 시뮬레이션
 @retry(
     stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=0.01, min=0.01, max=0.1),  # 테스트용: 대기 시간 최소화
+    wait=TEST_BACKOFF,
     retry=retry_if_exception_type(RetryableAPIError),
     before_sleep=before_sleep_log(logger, logging.WARNING),
     reraise=True,
@@ -57,18 +65,19 @@ async def simulate_imagen_call(fake_api_func):
 # _start_veo_operation과 동일한 @retry 설정
 @retry(
     stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=0.01, min=0.01, max=0.1),  # 테스트용
+    wait=TEST_BACKOFF,
     retry=retry_if_exception_type(RetryableAPIError),
     before_sleep=before_sleep_log(logger, logging.WARNING),
     reraise=True,
 )
 async def simulate_veo_start(fake_api_func):
     """_start_veo_operation의 에러 분류 로직을 재현"""
-    status_code, body = fake_api_func()
+    status_code, body, *rest = fake_api_func()
+    retry_after = rest[0] if rest else None
     if status_code == 429:
-        raise RetryableAPIError(f"Rate limit exceeded: {body}")
+        raise RetryableAPIError(f"Rate limit exceeded: {body}", retry_after=retry_after)
     if status_code >= 500:
-        raise RetryableAPIError(f"Server error {status_code}: {body}")
+        raise RetryableAPIError(f"Server error {status_code}: {body}", retry_after=retry_after)
     if status_code != 200:
         raise NonRetryableAPIError(f"Client error {status_code}: {body}")
     return body
@@ -202,6 +211,70 @@ async def test_veo_429_retry_then_succeed():
     assert call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_veo_429_waits_for_retry_after(vertex_ai):
+    """
+    시나리오: Veo 시작 → Retry-After 헤더가 있는 429 → 2번째 성공
+    기대: 백오프 대신 서버가 준 Retry-After만큼 대기 (vertex_ai._wait_retry_after_or 사용)
+    """
+    waits = []
+
+    def fake_api():
+        if not waits:
+            return (429, "rate limit exceeded", 0.05)
+        return (200, "operation-name-789")
+
+    retrying = simulate_veo_start.retry_with(
+        wait=vertex_ai._wait_retry_after_or(TEST_BACKOFF),
+        before_sleep=lambda state: waits.append(state.next_action.sleep),
+    )
+    result = await retrying(fake_api)
+
+    assert result == "operation-name-789"
+    assert waits == [0.05]
+
+
+@pytest.mark.asyncio
+async def test_veo_retry_after_is_capped(vertex_ai):
+    """
+    시나리오: Veo 시작 → Retry-After: 3600인 429 → 2번째 성공
+    기대: 서버 값 대신 RETRY_AFTER_MAX_WAIT까지만 대기 (워커/Job이 1시간 묶이지 않음)
+    """
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    def fake_api():
+        if not sleeps:
+            return (429, "rate limit exceeded", 3600.0)
+        return (200, "operation-name-999")
+
+    retrying = simulate_veo_start.retry_with(
+        wait=vertex_ai._wait_retry_after_or(TEST_BACKOFF),
+        sleep=fake_sleep,
+    )
+    result = await retrying(fake_api)
+
+    assert result == "operation-name-999"
+    assert sleeps == [vertex_ai.RETRY_AFTER_MAX_WAIT]
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("5", 5.0),
+    ("0.5", 0.5),
+    ("-3", 0.0),
+    (None, None),
+    ("", None),
+    ("Wed, 21 Oct 2015 07:28:00 GMT", None),  # HTTP-date 형식은 미지원 → 백오프 사용
+    ("inf", None),
+    ("nan", None),
+])
+def test_parse_retry_after(vertex_ai, value, expected):
+    """Retry-After 파싱: 초 단위 숫자만 사용, 음수는 0, inf/nan 같은 비유한 값은 무시"""
+    assert vertex_ai._parse_retry_after(value) == expected
+
+
 @pytest.mark.asyncio
 async def test_veo_500_retry_then_succeed():
     """
@@ -0,0 +1,191 @@
+"""
+Veo LRO 백그라운드 poller 단위 테스트
+
+테스트 대상: backend/app/services/vertex_ai.py (VertexAIService._poll_operation / _poller_loop)
+- 완료 결과 전달 / 실패 예외 전파 / 최대 대기 시간 초과
+- 다음 폴링 일정: 지수 증가 간격 또는 서버 Retry-After
+- 여러 Operation을 poller 1개가 동시에 처리
+- 새 Operation 등록 시 대기 중인 poller가 즉시 깨어나는지 검증
+- fetchPredictOperation 호출(_fetch_operation)은 stub으로 대체
+
+유형: Unit Test — LOAD_TEST_MODE로 임포트 (GCP SDK/인증 없이 poller만 사용)
+"""
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def service(vertex_ai):
+    """테스트마다 새 VertexAIService (poller는 테스트 종료 시 aclose로 정리)"""
+    svc = vertex_ai.VertexAIService()
+    svc.veo_fetch_url = "https://test/fetchPredictOperation"
+    yield svc
+    await svc.aclose()
+
+
+def stub_fetch(service, results: dict[str, list]):
+    """
+    _fetch_operation stub: Operation별로 미리 정한 응답을 순서대로 반환
+
+    각 응답은 (result, retry_after) 튜플 또는 예외. 호출 시각(loop.time())은 calls에 기록
+    """
+    calls: dict[str, list[float]] = {name: [] for name in results}
+
+    async def fake_fetch(url, operation_name, elapsed):
+        calls[operation_name].append(asyncio.get_running_loop().time())
+        outcome = results[operation_name].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    service._fetch_operation = fake_fetch
+    return calls
+
+
+async def wait_first_poll(service, calls, name):
+    """name의 첫 조회가 끝나 다음 폴링 일정이 잡힐 때까지 진행"""
+    while not calls[name] or service._pending[name].next_poll_at == service._pending[name].started_at:
+        await asyncio.sleep(0)
+
+
+# ===== 완료 / 실패 / 타임아웃 =====
+
+async def test_returns_result_when_operation_done(service):
+    """진행 중 응답 뒤 완료 응답 → 결과 반환, 추적 목록에서 제거, poller 종료"""
+    calls = stub_fetch(service, {
+        "op": [(None, 0.01), ({"videos": ["v"]}, None)],
+    })
+
+    result = await service._poll_operation("op")
+
+    assert result == {"videos": ["v"]}
+    assert len(calls["op"]) == 2
+    assert service._pending == {}
+    await asyncio.sleep(0)
+    assert service._poller_task.done()
+
+
+async def test_propagates_operation_error(service):
+    """조회 실패(예외) → 해당 Operation을 기다리는 쪽으로 그대로 전파"""
+    stub_fetch(service, {
+        "op": [(None, 0.01), Exception("Veo operation failed: internal")],
+    })
+
+    with pytest.raises(Exception, match="Veo operation failed: internal"):
+        await service._poll_operation("op")
+
+    assert service._pending == {}
+
+
+async def test_times_out_after_max_wait(service, vertex_ai, monkeypatch):
+    """LRO_MAX_WAIT_TIME 안에 끝나지 않으면 TimeoutError + 추적 목록에서 제거"""
+    monkeypatch.setattr(vertex_ai, "LRO_MAX_WAIT_TIME", 0.05)
+    stub_fetch(service, {
+        "op": [(None, 30.0)],
+    })
+
+    with pytest.raises(TimeoutError, match="timed out after 0.05 seconds"):
+        await service._poll_operation("op")
+
+    assert service._pending == {}
+
+
+# ===== 폴링 일정 =====
+
+async def test_backoff_interval_when_no_retry_after(service, vertex_ai):
+    """Retry-After 없음 → 현재 간격 뒤에 다시 조회하고 간격은 LRO_POLL_BACKOFF배로 증가"""
+    calls = stub_fetch(service, {
+        "op": [(None, None)],
+    })
+
+    task = asyncio.create_task(service._poll_operation("op"))
+    await wait_first_poll(service, calls, "op")
+
+    pending = service._pending["op"]
+    assert pending.next_poll_at - calls["op"][0] == pytest.approx(vertex_ai.LRO_POLL_INITIAL_INTERVAL, abs=0.05)
+    assert pending.delay == pytest.approx(vertex_ai.LRO_POLL_INITIAL_INTERVAL * vertex_ai.LRO_POLL_BACKOFF)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_backoff_interval_capped_at_max(service, vertex_ai):
+    """간격이 늘어나도 LRO_POLL_MAX_INTERVAL을 넘지 않음"""
+    calls = stub_fetch(service, {
+        "op": [(None, None)],
+    })
+
+    task = asyncio.create_task(service._poll_operation("op"))
+    while "op" not in service._pending:
+        await asyncio.sleep(0)
+    service._pending["op"].delay = vertex_ai.LRO_POLL_MAX_INTERVAL
+    await wait_first_poll(service, calls, "op")
+
+    assert service._pending["op"].delay == vertex_ai.LRO_POLL_MAX_INTERVAL
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_retry_after_overrides_backoff(service, vertex_ai):
+    """서버 Retry-After → 그 시간 뒤에 다시 조회하고 지수 간격은 증가시키지 않음"""
+    calls = stub_fetch(service, {
+        "op": [(None, 5.0)],
+    })
+
+    task = asyncio.create_task(service._poll_operation("op"))
+    await wait_first_poll(service, calls, "op")
+
+    pending = service._pending["op"]
+    assert pending.next_poll_at - calls["op"][0] == pytest.approx(5.0, abs=0.05)
+    assert pending.delay == vertex_ai.LRO_POLL_INITIAL_INTERVAL
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+# ===== 동시 처리 =====
+
+async def test_concurrent_operations_share_one_poller(service):
+    """두 Operation이 각자 일정대로 폴링되어 각자 결과를 받고, 한쪽 실패가 다른 쪽에 영향 없음"""
+    calls = stub_fetch(service, {
+        "a": [(None, 0.01), (None, 0.01), ({"op": "a"}, None)],
+        "b": [(None, 0.01), Exception("Veo operation failed: b")],
+    })
+
+    task_a = asyncio.create_task(service._poll_operation("a"))
+    task_b = asyncio.create_task(service._poll_operation("b"))
+    while service._poller_task is None:
+        await asyncio.sleep(0)
+    poller = service._poller_task
+
+    result_a, result_b = await asyncio.gather(task_a, task_b, return_exceptions=True)
+
+    assert result_a == {"op": "a"}
+    assert isinstance(result_b, Exception) and "failed: b" in str(result_b)
+    assert (len(calls["a"]), len(calls["b"])) == (3, 2)
+    assert service._poller_task is poller  # 두 번째 등록은 새 poller를 만들지 않음
+    assert service._pending == {}
+
+
+# ===== 새 Operation 등록 =====
+
+async def test_new_operation_wakes_sleeping_poller(service):
+    """a가 긴 Retry-After로 대기 중일 때 등록된 b는 a의 다음 폴링을 기다리지 않고 바로 조회"""
+    calls = stub_fetch(service, {
+        "a": [(None, 30.0), ({"op": "a"}, None)],
+        "b": [({"op": "b"}, None)],
+    })
+
+    task_a = asyncio.create_task(service._poll_operation("a"))
+    # a의 첫 조회 결과로 다음 폴링이 30초 뒤로 잡히고 poller가 대기에 들어갈 때까지 진행
+    await wait_first_poll(service, calls, "a")
+    await asyncio.sleep(0)
+
+    # poller는 a의 30초 Retry-After만큼 대기 중 → b 등록이 poller를 깨워야 함
+    result = await asyncio.wait_for(service._poll_operation("b"), timeout=1.0)
+
+    assert result == {"op": "b"}
+    assert len(calls["a"]) == 1  # a는 자기 일정(30초 뒤)대로 남아 있음
+    task_a.cancel()
+    await asyncio.gather(task_a, return_exceptions=True)
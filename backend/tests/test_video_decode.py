@@ -0,0 +1,40 @@
+"""
+비디오 base64 조각 디코딩 저장 단위 테스트
+
+테스트 대상: backend/app/services/vertex_ai.py (_decode_and_write)
+- 조각(VIDEO_DECODE_CHUNK) 단위로 디코딩해 쓴 파일이 전체 문자열을 한 번에 디코딩한 결과와 같은지 검증
+- 조각 경계에 걸치는 길이 / padding("=", "==") / 저장 디렉터리 생성
+
+유형: Unit Test — LOAD_TEST_MODE로 임포트, 파일은 tmp_path에 저장
+"""
+import base64
+import random
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def raw_sizes(chunk: int) -> dict[str, int]:
+    """인코딩 길이가 VIDEO_DECODE_CHUNK보다 크도록 고른 원본 바이트 수 (조각 1개 = 원본 chunk * 3/4 바이트)"""
+    per_chunk = chunk // 4 * 3
+    return {
+        "exact_multiple": per_chunk * 2,          # 인코딩 길이 = chunk * 2, padding 없음
+        "partial_no_padding": per_chunk * 2 + 3,  # 마지막 조각 4자, padding 없음
+        "padding_one": per_chunk * 2 + 2,         # 마지막 조각 "xxx="
+        "padding_two": per_chunk * 2 + 1,         # 마지막 조각 "xx=="
+    }
+
+
+@pytest.mark.parametrize("case", ["exact_multiple", "partial_no_padding", "padding_one", "padding_two"])
+def test_chunked_decode_matches_full_decode(vertex_ai, tmp_path, case):
+    """조각 디코딩 결과 == base64.b64decode(전체 문자열)"""
+    size = raw_sizes(vertex_ai.VIDEO_DECODE_CHUNK)[case]
+    raw = random.Random(size).randbytes(size)
+    encoded = base64.b64encode(raw).decode()
+    assert len(encoded) > vertex_ai.VIDEO_DECODE_CHUNK
+
+    file_path = tmp_path / "videos" / "job.mp4"  # 없는 디렉터리도 생성
+    vertex_ai._decode_and_write(str(file_path), encoded)
+
+    assert file_path.read_bytes() == base64.b64decode(encoded) == raw
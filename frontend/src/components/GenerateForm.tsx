@@ -201,7 +201,7 @@ export function GenerateForm({ mode, onSubmit, isLoading }: GenerateFormProps) {
           <input
             ref={fileInputRef}
             type="file"
-            accept="image/*"
+            accept="image/png,image/jpeg,image/webp"
             onChange={handleImageChange}
             disabled={isLoading}
             className="p-2 disabled:cursor-not-allowed"